@@ -18,6 +18,47 @@ const corsHeaders = {
   'Access-Control-Allow-Headers': 'Content-Type, Accept, Mcp-Session-Id, Mcp-Protocol-Version',
 };
 
+const corsHeaderEntries = Object.entries(corsHeaders);
+
+/**
+ * Add CORS headers to a transport response, in place when its headers are mutable
+ */
+function withCors(response: Response): Response {
+  try {
+    for (const [key, value] of corsHeaderEntries) {
+      response.headers.set(key, value);
+    }
+    return response;
+  } catch {
+    // Immutable headers: copy into a new response
+    const headers = new Headers(response.headers);
+    for (const [key, value] of corsHeaderEntries) {
+      headers.set(key, value);
+    }
+    return new Response(response.body, {
+      status: response.status,
+      statusText: response.statusText,
+      headers,
+    });
+  }
+}
+
+// Headers for JSON responses built by this route
+const jsonHeaders = {
+  ...corsHeaders,
+  'Content-Type': 'application/json',
+};
+
+// Health check payload is constant, so serialize it once at module load
+const healthResponseBody = JSON.stringify({
+  name: 'augments-mcp-server',
+  version: SERVER_VERSION,
+  status: 'healthy',
+  transport: 'streamable-http',
+  endpoint: '/api/mcp',
+  tools: 7,
+});
+
 /**
  * Handle OPTIONS requests for CORS preflight
  */
@@ -38,23 +79,10 @@ export async function GET(request: Request) {
 
   if (!isMcpRequest) {
     // Return health check response for non-MCP requests
-    return new Response(
-      JSON.stringify({
-        name: 'augments-mcp-server',
-        version: SERVER_VERSION,
-        status: 'healthy',
-        transport: 'streamable-http',
-        endpoint: '/api/mcp',
-        tools: 7,
-      }),
-      {
-        status: 200,
-        headers: {
-          ...corsHeaders,
-          'Content-Type': 'application/json',
-        },
-      }
-    );
+    return new Response(healthResponseBody, {
+      status: 200,
+      headers: jsonHeaders,
+    });
   }
 
   // Handle MCP GET request (for SSE streams)
@@ -69,17 +97,7 @@ export async function GET(request: Request) {
 
     const response = await transport.handleRequest(request);
 
-    // Add CORS headers to the response
-    const newHeaders = new Headers(response.headers);
-    Object.entries(corsHeaders).forEach(([key, value]) => {
-      newHeaders.set(key, value);
-    });
-
-    return new Response(response.body, {
-      status: response.status,
-      statusText: response.statusText,
-      headers: newHeaders,
-    });
+    return withCors(response);
   } catch (error) {
     logger.error('MCP GET request failed', {
       error: error instanceof Error ? error.message : String(error),
@@ -96,10 +114,7 @@ export async function GET(request: Request) {
       }),
       {
         status: 500,
-        headers: {
-          ...corsHeaders,
-          'Content-Type': 'application/json',
-        },
+        headers: jsonHeaders,
       }
     );
   }
@@ -121,17 +136,7 @@ export async function POST(request: Request) {
 
     const response = await transport.handleRequest(request);
 
-    // Add CORS headers to the response
-    const newHeaders = new Headers(response.headers);
-    Object.entries(corsHeaders).forEach(([key, value]) => {
-      newHeaders.set(key, value);
-    });
-
-    return new Response(response.body, {
-      status: response.status,
-      statusText: response.statusText,
-      headers: newHeaders,
-    });
+    return withCors(response);
   } catch (error) {
     logger.error('MCP POST request failed', {
       error: error instanceof Error ? error.message : String(error),
@@ -148,10 +153,7 @@ export async function POST(request: Request) {
       }),
       {
         status: 500,
-        headers: {
-          ...corsHeaders,
-          'Content-Type': 'application/json',
-        },
+        headers: jsonHeaders,
       }
     );
   }
@@ -172,17 +174,7 @@ export async function DELETE(request: Request) {
 
     const response = await transport.handleRequest(request);
 
-    // Add CORS headers to the response
-    const newHeaders = new Headers(response.headers);
-    Object.entries(corsHeaders).forEach(([key, value]) => {
-      newHeaders.set(key, value);
-    });
-
-    return new Response(response.body, {
-      status: response.status,
-      statusText: response.statusText,
-      headers: newHeaders,
-    });
+    return withCors(response);
   } catch (error) {
     logger.error('MCP DELETE request failed', {
       error: error instanceof Error ? error.message : String(error),
@@ -199,10 +191,7 @@ export async function DELETE(request: Request) {
       }),
       {
         status: 500,
-        headers: {
-          ...corsHeaders,
-          'Content-Type': 'application/json',
-        },
+        headers: jsonHeaders,
       }
     );
   }
@@ -0,0 +1,61 @@
+import { describe, it, expect, beforeEach } from 'vitest';
+import { FrequencySketch } from './frequency-sketch';
+
+describe('FrequencySketch', () => {
+  let sketch: FrequencySketch;
+
+  beforeEach(() => {
+    sketch = new FrequencySketch(16);
+  });
+
+  it('estimates zero for unseen keys', () => {
+    expect(sketch.estimate('missing')).toBe(0);
+  });
+
+  it('counts repeated increments', () => {
+    sketch.increment('a');
+    sketch.increment('a');
+    sketch.increment('a');
+    expect(sketch.estimate('a')).toBe(3);
+  });
+
+  it('saturates counters at 15', () => {
+    for (let i = 0; i < 40; i++) {
+      sketch.increment('hot');
+    }
+    expect(sketch.estimate('hot')).toBe(15);
+  });
+
+  it('ranks frequent keys above one-off keys', () => {
+    for (let i = 0; i < 5; i++) {
+      sketch.increment('popular');
+    }
+    for (let i = 0; i < 30; i++) {
+      sketch.increment(`scan-${i}`);
+    }
+    sketch.increment('popular');
+
+    expect(sketch.estimate('popular')).toBeGreaterThan(sketch.estimate('scan-0'));
+  });
+
+  it('halves counters after the sample period', () => {
+    for (let i = 0; i < 8; i++) {
+      sketch.increment('a');
+    }
+    expect(sketch.estimate('a')).toBe(8);
+
+    // Width is 64 for 16 expected entries, so aging happens after 640 accesses
+    for (let i = 8; i < 640; i++) {
+      sketch.increment('b');
+    }
+
+    expect(sketch.estimate('a')).toBe(4);
+    expect(sketch.estimate('b')).toBe(7);
+  });
+
+  it('clears all counters', () => {
+    sketch.increment('a');
+    sketch.clear();
+    expect(sketch.estimate('a')).toBe(0);
+  });
+});
@@ -0,0 +1,110 @@
+/**
+ * Frequency Sketch
+ *
+ * Count-min sketch with small saturating counters and periodic aging. Used as a
+ * TinyLFU-style admission filter: it estimates how often a key has been seen
+ * recently in constant memory, so one-off lookups don't displace popular entries.
+ */
+
+/** Number of counter rows (independent hash functions) */
+const DEPTH = 4;
+
+/** Counters saturate here, as with 4-bit counters */
+const MAX_COUNT = 15;
+
+/**
+ * 32-bit FNV-1a hash of a string
+ */
+function fnv1a(key: string): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < key.length; i++) {
+    hash ^= key.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+}
+
+/**
+ * Approximate per-key access frequency with bounded memory
+ */
+export class FrequencySketch {
+  private readonly counters: Uint8Array;
+  private readonly width: number;
+  private readonly sampleSize: number;
+  private additions = 0;
+
+  /**
+   * @param expectedEntries Number of entries the protected cache holds
+   */
+  constructor(expectedEntries: number) {
+    // Power-of-two width so row indexes can be masked instead of taken modulo
+    let width = 16;
+    while (width < expectedEntries * 4) {
+      width *= 2;
+    }
+
+    this.width = width;
+    this.counters = new Uint8Array(width * DEPTH);
+    // Halve all counters after this many accesses so old popularity fades
+    this.sampleSize = width * 10;
+  }
+
+  /**
+   * Record one access to a key
+   */
+  increment(key: string): void {
+    const hash = fnv1a(key);
+    const step = this.secondaryHash(hash);
+
+    for (let row = 0; row < DEPTH; row++) {
+      const index = this.indexOf(hash, step, row);
+      if (this.counters[index] < MAX_COUNT) {
+        this.counters[index]++;
+      }
+    }
+
+    if (++this.additions >= this.sampleSize) {
+      this.age();
+    }
+  }
+
+  /**
+   * Estimated number of recent accesses to a key (never underestimates before aging)
+   */
+  estimate(key: string): number {
+    const hash = fnv1a(key);
+    const step = this.secondaryHash(hash);
+    let min = MAX_COUNT;
+
+    for (let row = 0; row < DEPTH; row++) {
+      min = Math.min(min, this.counters[this.indexOf(hash, step, row)]);
+    }
+
+    return min;
+  }
+
+  /**
+   * Reset all counters
+   */
+  clear(): void {
+    this.counters.fill(0);
+    this.additions = 0;
+  }
+
+  private secondaryHash(hash: number): number {
+    // Odd step so successive rows probe distinct columns
+    return (Math.imul(hash ^ (hash >>> 16), 0x45d9f3b) >>> 0) | 1;
+  }
+
+  private indexOf(hash: number, step: number, row: number): number {
+    const column = (hash + Math.imul(row, step)) & (this.width - 1);
+    return row * this.width + column;
+  }
+
+  private age(): void {
+    for (let i = 0; i < this.counters.length; i++) {
+      this.counters[i] >>= 1;
+    }
+    this.additions >>>= 1;
+  }
+}
@@ -2,6 +2,12 @@
  * Cache module exports
  */
 
-export { KVCache, getCache } from './kv-cache';
-export { generateCacheKey, determineTTL, CacheTTL } from './strategies';
+export { KVCache, getCache, type CacheLookup, type FrameworkCacheInfo } from './kv-cache';
+export {
+  generateCacheKey,
+  generateExamplesCachePath,
+  generateFrameworkTagKey,
+  determineTTL,
+  CacheTTL,
+} from './strategies';
 export { UnifiedCache, type UnifiedCacheOptions, type CacheMetrics } from './unified-cache';
@@ -0,0 +1,405 @@
+import { describe, it, expect, beforeEach } from 'vitest';
+import { KVCache } from './kv-cache';
+
+/**
+ * In-memory stand-in for the Upstash client, covering the commands KVCache sends
+ */
+class StubRedis {
+  readonly values = new Map<string, unknown>();
+  /** Sorted sets as member -> score */
+  readonly sortedSets = new Map<string, Map<string, number>>();
+  /** Pipelines sent so far */
+  execCount = 0;
+
+  async get(key: string): Promise<unknown> {
+    return this.values.get(key) ?? null;
+  }
+
+  async mget(...keys: string[]): Promise<unknown[]> {
+    return keys.map((key) => this.values.get(key) ?? null);
+  }
+
+  async zrange(key: string, min: number, max: '+inf', _opts: { byScore: true }): Promise<string[]> {
+    return [...(this.sortedSets.get(key) ?? [])]
+      .filter(([, score]) => score >= min)
+      .sort(([, a], [, b]) => a - b)
+      .map(([member]) => member);
+  }
+
+  pipeline() {
+    const commands: Array<() => unknown> = [];
+    const pipeline = {
+      set: (key: string, value: unknown) => {
+        // Stored as the client would serialize it
+        commands.push(() => this.values.set(key, JSON.parse(JSON.stringify(value))));
+        return pipeline;
+      },
+      del: (...keys: string[]) => {
+        commands.push(
+          () => keys.filter((key) => this.values.delete(key) || this.sortedSets.delete(key)).length
+        );
+        return pipeline;
+      },
+      zadd: (key: string, { score, member }: { score: number; member: string }) => {
+        commands.push(() => {
+          const members = this.sortedSets.get(key) ?? new Map<string, number>();
+          this.sortedSets.set(key, members);
+          members.set(member, score);
+        });
+        return pipeline;
+      },
+      zrem: (key: string, ...members: string[]) => {
+        commands.push(
+          () => members.filter((member) => this.sortedSets.get(key)?.delete(member)).length
+        );
+        return pipeline;
+      },
+      zremrangebyscore: (key: string, _min: '-inf', max: number) => {
+        commands.push(() => {
+          for (const [member, score] of this.sortedSets.get(key) ?? []) {
+            if (score <= max) this.sortedSets.get(key)!.delete(member);
+          }
+        });
+        return pipeline;
+      },
+      expire: () => {
+        commands.push(() => 1);
+        return pipeline;
+      },
+      exec: async () => {
+        this.execCount++;
+        return commands.map((command) => command());
+      },
+    };
+    return pipeline;
+  }
+}
+
+/**
+ * Attach a stub client; the real one is private and only created from config
+ */
+function attachRedis(cache: KVCache, redis: StubRedis): void {
+  (cache as unknown as { redis: StubRedis }).redis = redis;
+}
+
+describe('KVCache (local tier)', () => {
+  let cache: KVCache;
+
+  beforeEach(() => {
+    // Capacity is read at construction
+    process.env.CACHE_MAX_ENTRIES = '10';
+    cache = new KVCache();
+    delete process.env.CACHE_MAX_ENTRIES;
+  });
+
+  describe('basic get/set', () => {
+    it('returns null for missing keys', async () => {
+      expect(await cache.get('react', 'hooks')).toBeNull();
+    });
+
+    it('stores and retrieves content', async () => {
+      await cache.set('react', 'react docs', 'hooks');
+      expect(await cache.get('react', 'hooks')).toBe('react docs');
+    });
+
+    it('replaces an existing key without evicting other entries', async () => {
+      for (let i = 0; i < 10; i++) {
+        await cache.set('fw', `content-${i}`, `page-${i}`);
+      }
+      await cache.set('fw', 'updated', 'page-5');
+
+      expect(await cache.get('fw', 'page-5')).toBe('updated');
+      expect(await cache.get('fw', 'page-0')).toBe('content-0');
+      expect(cache.getStats().memory_entries).toBe(10);
+    });
+  });
+
+  describe('S3-FIFO eviction', () => {
+    it('keeps entries that were read while one-off entries churn', async () => {
+      await cache.set('fw', 'hot content', 'hot');
+      await cache.get('fw', 'hot');
+
+      for (let i = 0; i < 30; i++) {
+        await cache.set('fw', `scan-${i}`, `scan-${i}`);
+      }
+
+      expect(await cache.get('fw', 'hot')).toBe('hot content');
+      expect(await cache.get('fw', 'scan-0')).toBeNull();
+      expect(cache.getStats().memory_entries).toBe(10);
+    });
+
+    it('admits recently evicted keys straight to the main queue', async () => {
+      for (let i = 0; i < 11; i++) {
+        await cache.set('fw', `scan-${i}`, `scan-${i}`);
+      }
+      // scan-0 was evicted from the small queue and is remembered as a ghost
+      expect(await cache.get('fw', 'scan-0')).toBeNull();
+
+      await cache.set('fw', 'returning', 'scan-0');
+      for (let i = 11; i < 30; i++) {
+        await cache.set('fw', `scan-${i}`, `scan-${i}`);
+      }
+
+      expect(await cache.get('fw', 'scan-0')).toBe('returning');
+    });
+  });
+
+  describe('invalidation', () => {
+    it('invalidates a single key', async () => {
+      await cache.set('react', 'react docs', 'hooks');
+      await cache.invalidate('react', 'hooks');
+      expect(await cache.get('react', 'hooks')).toBeNull();
+    });
+
+    it('clears all local entries for a framework', async () => {
+      await cache.set('react', 'a', 'one');
+      await cache.set('react', 'b', 'two');
+      await cache.set('vue', 'c', 'one');
+
+      expect(await cache.clearFramework('react')).toBe(2);
+      expect(await cache.get('react', 'one')).toBeNull();
+      expect(await cache.get('vue', 'one')).toBe('c');
+      expect(cache.getStats().memory_bytes).toBe(2);
+    });
+  });
+
+  describe('getMany', () => {
+    it('returns content in request order with null for misses', async () => {
+      await cache.set('react', 'react hooks', 'hooks');
+      await cache.set('vue', 'vue docs');
+
+      const results = await cache.getMany([
+        { framework: 'vue' },
+        { framework: 'react', path: 'missing' },
+        { framework: 'react', path: 'hooks', sourceType: 'docs' },
+      ]);
+
+      expect(results).toEqual(['vue docs', null, 'react hooks']);
+    });
+  });
+
+  describe('getFrameworksCacheInfo', () => {
+    it('summarizes each requested framework in order', async () => {
+      await cache.set('react', 'abc', 'one');
+      await cache.set('react', 'de', 'two');
+      await cache.set('vue', 'f');
+
+      const [vue, react, svelte] = cache.getFrameworksCacheInfo(['vue', 'react', 'svelte']);
+
+      // Sizes are UTF-16 bytes, the same unit as memory_bytes
+      expect(vue).toMatchObject({ framework: 'vue', memory_entries: 1, total_size_bytes: 2 });
+      expect(react).toMatchObject({ framework: 'react', memory_entries: 2, total_size_bytes: 10 });
+      expect(vue.total_size_bytes + react.total_size_bytes).toBe(cache.getStats().memory_bytes);
+      expect(react.last_cached_at).not.toBeNull();
+      expect(svelte).toEqual({
+        framework: 'svelte',
+        memory_entries: 0,
+        total_size_bytes: 0,
+        last_cached_at: null,
+      });
+    });
+  });
+
+  describe('getOrSet', () => {
+    it('runs the fetcher once for concurrent misses', async () => {
+      let calls = 0;
+      const fetcher = async () => {
+        calls++;
+        await new Promise((resolve) => setTimeout(resolve, 10));
+        return 'fetched';
+      };
+
+      const results = await Promise.all([
+        cache.getOrSet('react', '', 'docs', 'latest', fetcher),
+        cache.getOrSet('react', '', 'docs', 'latest', fetcher),
+        cache.getOrSet('react', '', 'docs', 'latest', fetcher),
+      ]);
+
+      expect(results).toEqual(['fetched', 'fetched', 'fetched']);
+      expect(calls).toBe(1);
+      expect(await cache.get('react')).toBe('fetched');
+    });
+
+    it('does not cache empty results', async () => {
+      expect(await cache.getOrSet('react', '', 'docs', 'latest', async () => null)).toBeNull();
+      expect(await cache.get('react')).toBeNull();
+    });
+  });
+});
+
+describe('KVCache (Redis tier)', () => {
+  let cache: KVCache;
+  let redis: StubRedis;
+
+  beforeEach(() => {
+    cache = new KVCache();
+    redis = new StubRedis();
+    attachRedis(cache, redis);
+  });
+
+  describe('batched writes', () => {
+    it('writes entries to Redis once the batch is flushed', async () => {
+      await Promise.all([cache.set('react', 'a', 'one'), cache.set('vue', 'b', 'one')]);
+
+      expect(redis.values.size).toBe(2);
+    });
+
+    it('cancels a queued write when its key is invalidated', async () => {
+      const pending = cache.set('svelte', 'old', 'z');
+      await cache.invalidate('svelte', 'z');
+      await pending;
+
+      expect(redis.values.size).toBe(0);
+      expect(await cache.get('svelte', 'z')).toBeNull();
+    });
+
+    it('cancels queued writes for a cleared framework', async () => {
+      const pending = Promise.all([
+        cache.set('solid', 'a', 'one'),
+        cache.set('solid', 'b', 'two'),
+        cache.set('vue', 'c', 'one'),
+      ]);
+      expect(await cache.clearFramework('solid')).toBe(2);
+      await pending;
+
+      expect([...redis.values.keys()]).toEqual(['augments:docs:vue:one']);
+    });
+
+    describe('while a batch is being compressed', () => {
+      const largeContent = '# Guide\n' + 'Markdown text with `code` and links.\n'.repeat(2000);
+
+      /**
+       * Wait until the flush timer has fired and taken the batch, before compression settles
+       */
+      const batchWindowElapsed = () => new Promise((resolve) => setTimeout(resolve, 5));
+
+      it('sends later writes in the next flush instead of holding up the batch', async () => {
+        const first = cache.set('react', largeContent, 'guide');
+        await batchWindowElapsed();
+        const second = cache.set('react', 'b', 'two');
+
+        await first;
+        expect(redis.execCount).toBe(1);
+        expect(redis.values.has('augments:docs:react:two')).toBe(false);
+
+        await second;
+        expect(redis.execCount).toBe(2);
+        expect(redis.values.has('augments:docs:react:two')).toBe(true);
+      });
+
+      it('cancels a write whose key is invalidated before the batch is sent', async () => {
+        const pending = cache.set('react', largeContent, 'guide');
+        await batchWindowElapsed();
+        await cache.invalidate('react', 'guide');
+        await pending;
+
+        expect(redis.values.size).toBe(0);
+        expect(redis.sortedSets.get('augments:keys:react')).toBeUndefined();
+      });
+    });
+  });
+
+  describe('compression', () => {
+    const largeContent = '# Guide\n' + 'Markdown text with `code` and links.\n'.repeat(2000);
+
+    it('round-trips large content through brotli', async () => {
+      await cache.set('react', largeContent, 'guide');
+
+      const stored = redis.values.get('augments:docs:react:guide') as {
+        content: string;
+        content_encoding?: string;
+      };
+      expect(stored.content_encoding).toBe('br');
+      expect(stored.content.length).toBeLessThan(largeContent.length);
+
+      // A fresh instance has nothing locally, so this read decodes the Redis record
+      const reader = new KVCache();
+      attachRedis(reader, redis);
+      expect(await reader.get('react', 'guide')).toBe(largeContent);
+    });
+
+    it('stores small content uncompressed', async () => {
+      await cache.set('react', 'short', 'intro');
+
+      const stored = redis.values.get('augments:docs:react:intro') as {
+        content: string;
+        content_encoding?: string;
+      };
+      expect(stored.content_encoding).toBeUndefined();
+      expect(stored.content).toBe('short');
+    });
+
+    it('treats a corrupt entry as a miss without failing the rest of a batch', async () => {
+      await Promise.all([
+        cache.set('react', largeContent, 'guide'),
+        cache.set('react', largeContent, 'broken'),
+      ]);
+      const broken = redis.values.get('augments:docs:react:broken') as { content: string };
+      broken.content = broken.content.slice(0, 20);
+
+      const reader = new KVCache();
+      attachRedis(reader, redis);
+      expect(
+        await reader.getMany([
+          { framework: 'react', path: 'broken' },
+          { framework: 'react', path: 'guide' },
+        ])
+      ).toEqual([null, largeContent]);
+    });
+  });
+
+  describe('framework tag index', () => {
+    const tagKey = 'augments:keys:react';
+
+    it('indexes written keys and deletes them when the framework is cleared', async () => {
+      await Promise.all([cache.set('react', 'a', 'one'), cache.set('react', 'b', 'two')]);
+      expect([...redis.sortedSets.get(tagKey)!.keys()]).toEqual([
+        'augments:docs:react:one',
+        'augments:docs:react:two',
+      ]);
+
+      // Two local entries plus two Redis keys
+      expect(await cache.clearFramework('react')).toBe(4);
+      expect(redis.values.size).toBe(0);
+      expect(redis.sortedSets.get(tagKey)!.size).toBe(0);
+    });
+
+    it('keeps keys indexed while a framework is being cleared', async () => {
+      await cache.set('react', 'a', 'one');
+      const zrange = redis.zrange.bind(redis);
+      redis.zrange = async (...args) => {
+        const members = await zrange(...args);
+        // Another instance indexes a key between the read and the delete
+        redis.sortedSets.get(tagKey)!.set('augments:docs:react:late', Date.now() + 60_000);
+        return members;
+      };
+
+      await cache.clearFramework('react');
+
+      expect([...redis.sortedSets.get(tagKey)!.keys()]).toEqual(['augments:docs:react:late']);
+    });
+
+    it('removes an invalidated key from the index', async () => {
+      await Promise.all([cache.set('react', 'a', 'one'), cache.set('react', 'b', 'two')]);
+      await cache.invalidate('react', 'one');
+
+      expect([...redis.sortedSets.get(tagKey)!.keys()]).toEqual(['augments:docs:react:two']);
+    });
+
+    it('prunes members whose entries have expired when writing', async () => {
+      redis.sortedSets.set(tagKey, new Map([['augments:docs:react:stale', Date.now() - 1000]]));
+
+      await cache.set('react', 'fresh', 'fresh');
+
+      expect([...redis.sortedSets.get(tagKey)!.keys()]).toEqual(['augments:docs:react:fresh']);
+    });
+
+    it('skips expired members when clearing a framework', async () => {
+      await cache.set('react', 'fresh', 'fresh');
+      redis.sortedSets.get(tagKey)!.set('augments:docs:react:stale', Date.now() - 1000);
+
+      // The local entry plus the live Redis key; the stale member isn't sent to DEL
+      expect(await cache.clearFramework('react')).toBe(2);
+    });
+  });
+});
@@ -2,18 +2,198 @@
  * Upstash Redis cache implementation for serverless environments
  */
 
+import { promisify } from 'util';
+import { brotliCompress, brotliDecompress, constants as zlibConstants } from 'zlib';
 import { Redis } from '@upstash/redis';
 import { config } from '@/config';
 import { type CacheEntry, type CacheStats } from '@/types';
-import { generateCacheKey, determineTTL, CacheTTL } from './strategies';
+import { generateCacheKey, generateFrameworkTagKey, determineTTL, CacheTTL } from './strategies';
+import { FrequencySketch } from './frequency-sketch';
 import { getLogger } from '@/utils/logger';
 
 const logger = getLogger('kv-cache');
 
+const compress = promisify(brotliCompress);
+const decompress = promisify(brotliDecompress);
+
+/**
+ * Content at least this long is brotli-compressed before it is written to Redis
+ */
+const COMPRESSION_THRESHOLD = 32 * 1024;
+
+/**
+ * Brotli quality for Redis content: a fast setting, since docs are compressed on the request path
+ */
+const COMPRESSION_QUALITY = 4;
+
+/**
+ * Compress large content for Redis; smaller entries, and any that fail to compress, are stored as-is
+ */
+async function encodeForRemote(entry: CacheEntry): Promise<CacheEntry> {
+  if (entry.content.length < COMPRESSION_THRESHOLD) {
+    return entry;
+  }
+
+  try {
+    const compressed = await compress(Buffer.from(entry.content, 'utf-8'), {
+      params: {
+        [zlibConstants.BROTLI_PARAM_MODE]: zlibConstants.BROTLI_MODE_TEXT,
+        [zlibConstants.BROTLI_PARAM_QUALITY]: COMPRESSION_QUALITY,
+      },
+    });
+    return { ...entry, content: compressed.toString('base64'), content_encoding: 'br' };
+  } catch (error) {
+    logger.warn('Cache content compression failed, storing uncompressed', {
+      error: error instanceof Error ? error.message : String(error),
+    });
+    return entry;
+  }
+}
+
+/**
+ * Restore plain-text content of an entry read from Redis
+ */
+async function decodeFromRemote(entry: CacheEntry): Promise<CacheEntry> {
+  if (entry.content_encoding !== 'br') {
+    return entry;
+  }
+
+  const decompressed = await decompress(Buffer.from(entry.content, 'base64'));
+  const plain: CacheEntry = { ...entry, content: decompressed.toString('utf-8') };
+  delete plain.content_encoding;
+  return plain;
+}
+
+/**
+ * How long set() waits for other writes to join its Redis pipeline
+ */
+const REMOTE_WRITE_BATCH_WINDOW_MS = 5;
+
+/**
+ * Redis write waiting for the next batched flush
+ */
+interface PendingWrite {
+  cacheKey: string;
+  entry: CacheEntry;
+  ttl: number;
+  /** Set when invalidation lands while the write's batch is still being compressed */
+  cancelled?: boolean;
+}
+
+/**
+ * One entry requested from getMany()
+ */
+export interface CacheLookup {
+  framework: string;
+  path?: string;
+  sourceType?: string;
+}
+
+/**
+ * Local cache usage for one framework
+ */
+export interface FrameworkCacheInfo {
+  framework: string;
+  memory_entries: number;
+  total_size_bytes: number;
+  last_cached_at: number | null;
+}
+
+/**
+ * Hits recorded per local entry are capped here (2-bit counter)
+ */
+const MAX_LOCAL_FREQUENCY = 3;
+
+/**
+ * Share of local capacity reserved for the small probationary queue
+ */
+const SMALL_QUEUE_RATIO = 0.1;
+
+/**
+ * Approximate in-memory size of cached content (JS strings are UTF-16)
+ */
+function contentSize(content: string): number {
+  return content.length * 2;
+}
+
+/**
+ * Locally cached entry with S3-FIFO bookkeeping. Flattened into one class so every
+ * local entry has the same fixed shape, whereas CacheEntry objects parsed from Redis
+ * vary with their optional fields.
+ */
+class LocalEntry {
+  readonly content: string;
+  readonly framework: string;
+  readonly sourceType: string;
+  readonly version: string;
+  readonly cachedAt: number;
+  readonly expiresAt: number;
+  /** Approximate in-memory size (JS strings are UTF-16) */
+  readonly size: number;
+  /** Hits since insertion (or since the last pass through the main queue) */
+  freq: number = 0;
+  /** Whether the key sits in the main queue rather than the small one */
+  inMain: boolean = false;
+
+  constructor(
+    content: string,
+    framework: string,
+    sourceType: string,
+    version: string,
+    cachedAt: number,
+    expiresAt: number
+  ) {
+    this.content = content;
+    this.framework = framework;
+    this.sourceType = sourceType;
+    this.version = version;
+    this.cachedAt = cachedAt;
+    this.expiresAt = expiresAt;
+    this.size = contentSize(content);
+  }
+
+  /**
+   * Build a local entry from a record read back from Redis
+   */
+  static fromRecord(entry: CacheEntry): LocalEntry {
+    return new LocalEntry(
+      entry.content,
+      entry.framework,
+      entry.source_type,
+      entry.version,
+      entry.cached_at,
+      entry.expires_at ?? entry.cached_at + entry.ttl * 1000
+    );
+  }
+}
+
 export class KVCache {
   private redis: Redis | null = null;
-  private localCache: Map<string, CacheEntry> = new Map();
+  // S3-FIFO: new keys enter a small probationary FIFO and move to the main FIFO
+  // only if hit while there. Hits just bump a counter, so reads never reorder anything.
+  private localCache: Map<string, LocalEntry> = new Map();
+  private smallQueue: Set<string> = new Set();
+  private mainQueue: Set<string> = new Set();
+  // Keys recently evicted from the small queue; if they come back they skip probation
+  private ghostKeys: Set<string> = new Set();
   private readonly MAX_LOCAL_ENTRIES = parseInt(process.env.CACHE_MAX_ENTRIES || '300', 10);
+  private readonly SMALL_QUEUE_TARGET = Math.max(
+    1,
+    Math.floor(this.MAX_LOCAL_ENTRIES * SMALL_QUEUE_RATIO)
+  );
+  // Large docs dominate instance memory, so the local tier is bounded by size as well as count
+  private readonly MAX_LOCAL_BYTES = parseInt(
+    process.env.CACHE_MAX_LOCAL_BYTES || String(64 * 1024 * 1024),
+    10
+  );
+  private localBytes = 0;
+  // Admission filter: Redis hits only displace local entries that are used less often
+  private frequencySketch = new FrequencySketch(this.MAX_LOCAL_ENTRIES);
+  private inFlightFills: Map<string, Promise<string | null>> = new Map();
+  private pendingWrites: PendingWrite[] = [];
+  private pendingFlush: Promise<void> | null = null;
+  // Writes taken by a flush but not yet sent (still being compressed)
+  private flushingWrites: Set<PendingWrite> = new Set();
 
   constructor() {
     this.initRedis();
@@ -25,6 +205,8 @@ export class KVCache {
         this.redis = new Redis({
           url: config.upstashRedisUrl,
           token: config.upstashRedisToken,
+          // Entries are JSON text, so skip base64-wrapping every response and decoding it here
+          responseEncoding: false,
         });
         logger.info('Upstash Redis cache initialized');
       } catch (error) {
@@ -47,26 +229,30 @@ export class KVCache {
     sourceType: string = 'docs'
   ): Promise<string | null> {
     const cacheKey = generateCacheKey(framework, path, sourceType);
-
-    // Check local cache first (with LRU promotion)
-    const localEntry = this.localCache.get(cacheKey);
-    if (localEntry && !this.isExpired(localEntry)) {
-      // LRU: move to end by deleting and re-inserting
-      this.localCache.delete(cacheKey);
-      this.localCache.set(cacheKey, localEntry);
-      logger.debug('Cache hit (local)', { framework, path });
-      return localEntry.content;
+    this.frequencySketch.increment(cacheKey);
+
+    // Check local cache first. A hit only bumps the entry's counter (no reordering),
+    // and log context is built only when debug logging is on.
+    const localContent = this.getLocal(cacheKey);
+    if (localContent !== null) {
+      if (logger.isDebugEnabled()) {
+        logger.debug('Cache hit (local)', { framework, path });
+      }
+      return localContent;
     }
 
     // Check Redis if available
     if (this.redis) {
       try {
-        const entry = await this.redis.get<CacheEntry>(cacheKey);
-        if (entry && !this.isExpired(entry)) {
-          // Promote to local cache
-          this.addToLocalCache(cacheKey, entry);
-          logger.debug('Cache hit (redis)', { framework, path });
-          return entry.content;
+        const content = await this.acceptRemote(
+          cacheKey,
+          await this.redis.get<CacheEntry>(cacheKey)
+        );
+        if (content !== null) {
+          if (logger.isDebugEnabled()) {
+            logger.debug('Cache hit (redis)', { framework, path });
+          }
+          return content;
         }
       } catch (error) {
         logger.warn('Redis get error', {
@@ -76,10 +262,59 @@ export class KVCache {
       }
     }
 
-    logger.debug('Cache miss', { framework, path });
+    if (logger.isDebugEnabled()) {
+      logger.debug('Cache miss', { framework, path });
+    }
     return null;
   }
 
+  /**
+   * Get cached content for several entries at once, in request order (null for misses).
+   * Local misses are read from Redis together in a single MGET round trip.
+   */
+  async getMany(lookups: CacheLookup[]): Promise<Array<string | null>> {
+    const cacheKeys = lookups.map(({ framework, path = '', sourceType = 'docs' }) =>
+      generateCacheKey(framework, path, sourceType)
+    );
+    const results: Array<string | null> = new Array(cacheKeys.length).fill(null);
+    const remoteIndexes: number[] = [];
+
+    cacheKeys.forEach((cacheKey, index) => {
+      this.frequencySketch.increment(cacheKey);
+      const localContent = this.getLocal(cacheKey);
+      if (localContent !== null) {
+        results[index] = localContent;
+      } else {
+        remoteIndexes.push(index);
+      }
+    });
+
+    if (this.redis && remoteIndexes.length) {
+      const remoteKeys = remoteIndexes.map((index) => cacheKeys[index]);
+      try {
+        const stored = await this.redis.mget<Array<CacheEntry | null>>(...remoteKeys);
+        await Promise.all(
+          remoteIndexes.map(async (index, position) => {
+            results[index] = await this.acceptRemote(cacheKeys[index], stored[position]);
+          })
+        );
+      } catch (error) {
+        logger.warn('Redis mget error', {
+          keys: remoteKeys,
+          error: error instanceof Error ? error.message : String(error),
+        });
+      }
+    }
+
+    if (logger.isDebugEnabled()) {
+      logger.debug('Cache batch lookup', {
+        requested: cacheKeys.length,
+        hits: results.filter((content) => content !== null).length,
+      });
+    }
+    return results;
+  }
+
   /**
    * Store content in cache
    */
@@ -93,35 +328,73 @@ export class KVCache {
   ): Promise<void> {
     const cacheKey = generateCacheKey(framework, path, sourceType);
     const ttl = determineTTL(version, branch);
+    this.frequencySketch.increment(cacheKey);
 
-    const entry: CacheEntry = {
-      content,
-      cached_at: Date.now(),
-      ttl,
-      version,
-      framework,
-      source_type: sourceType,
-    };
+    const cachedAt = Date.now();
+    const expiresAt = cachedAt + ttl * 1000;
 
     // Store in local cache
-    this.addToLocalCache(cacheKey, entry);
+    this.addToLocalCache(
+      cacheKey,
+      new LocalEntry(content, framework, sourceType, version, cachedAt, expiresAt)
+    );
 
-    // Store in Redis if available
+    // Store in Redis if available (the only place the serialized record is needed);
+    // resolves once the batch containing this write is flushed
     if (this.redis) {
-      try {
-        await this.redis.set(cacheKey, entry, { ex: ttl });
-        logger.debug('Content cached', {
-          framework,
-          path,
-          ttl,
-          size: content.length,
-        });
-      } catch (error) {
-        logger.warn('Redis set error', {
-          key: cacheKey,
-          error: error instanceof Error ? error.message : String(error),
-        });
+      const entry: CacheEntry = {
+        content,
+        cached_at: cachedAt,
+        ttl,
+        expires_at: expiresAt,
+        version,
+        framework,
+        source_type: sourceType,
+      };
+      await this.queueRemoteWrite({ cacheKey, entry, ttl });
+    }
+  }
+
+  /**
+   * Get cached content, or produce and store it on a miss.
+   * Concurrent misses for the same key share a single fetcher call.
+   */
+  async getOrSet(
+    framework: string,
+    path: string,
+    sourceType: string,
+    version: string,
+    fetcher: () => Promise<string | null>
+  ): Promise<string | null> {
+    const cached = await this.get(framework, path, sourceType);
+    if (cached) {
+      return cached;
+    }
+
+    const cacheKey = generateCacheKey(framework, path, sourceType);
+
+    // Check for in-flight fill (deduplication)
+    const inFlight = this.inFlightFills.get(cacheKey);
+    if (inFlight) {
+      if (logger.isDebugEnabled()) {
+        logger.debug('Awaiting in-flight cache fill', { framework, path });
+      }
+      return inFlight;
+    }
+
+    const fill = (async () => {
+      const content = await fetcher();
+      if (content) {
+        await this.set(framework, content, path, sourceType, version);
       }
+      return content;
+    })();
+    this.inFlightFills.set(cacheKey, fill);
+
+    try {
+      return await fill;
+    } finally {
+      this.inFlightFills.delete(cacheKey);
     }
   }
 
@@ -136,13 +409,21 @@ export class KVCache {
     const cacheKey = generateCacheKey(framework, path, sourceType);
 
     // Remove from local cache
-    this.localCache.delete(cacheKey);
+    this.removeFromLocalCache(cacheKey);
 
     // Remove from Redis if available
     if (this.redis) {
+      // Cancel a queued write for this key so it can't land after the delete
+      this.cancelRemoteWrites((write) => write.cacheKey === cacheKey);
+
       try {
-        await this.redis.del(cacheKey);
-        logger.debug('Cache invalidated', { framework, path });
+        const pipeline = this.redis.pipeline();
+        pipeline.del(cacheKey);
+        pipeline.zrem(generateFrameworkTagKey(framework), cacheKey);
+        await pipeline.exec();
+        if (logger.isDebugEnabled()) {
+          logger.debug('Cache invalidated', { framework, path });
+        }
       } catch (error) {
         logger.warn('Redis delete error', {
           key: cacheKey,
@@ -159,21 +440,31 @@ export class KVCache {
     let cleared = 0;
 
     // Clear from local cache
-    for (const [key, entry] of this.localCache.entries()) {
-      if (entry.framework === framework) {
-        this.localCache.delete(key);
+    for (const [key, local] of this.localCache.entries()) {
+      if (local.framework === framework) {
+        this.removeFromLocalCache(key);
         cleared++;
       }
     }
 
     // Clear from Redis if available
     if (this.redis) {
+      // Cancel queued writes for this framework so they can't land after the delete
+      this.cancelRemoteWrites((write) => write.entry.framework === framework);
+
       try {
-        const pattern = `augments:*:${framework}:*`;
-        const keys = await this.redis.keys(pattern);
+        // Tag index lookup instead of a KEYS scan; members already past expiry are skipped
+        const tagKey = generateFrameworkTagKey(framework);
+        const keys = await this.redis.zrange<string[]>(tagKey, Date.now(), '+inf', {
+          byScore: true,
+        });
         if (keys.length > 0) {
-          await this.redis.del(...keys);
-          cleared += keys.length;
+          // Remove only the members read; keys indexed since then must stay in the index
+          const pipeline = this.redis.pipeline();
+          pipeline.del(...keys);
+          pipeline.zrem(tagKey, ...keys);
+          const [deleted] = await pipeline.exec<[number, number]>();
+          cleared += deleted;
         }
       } catch (error) {
         logger.warn('Redis clear framework error', {
@@ -195,6 +486,8 @@ export class KVCache {
       memory_entries: this.localCache.size,
       memory_max_entries: this.MAX_LOCAL_ENTRIES,
       memory_utilization_pct: Math.round((this.localCache.size / this.MAX_LOCAL_ENTRIES) * 100),
+      memory_bytes: this.localBytes,
+      memory_max_bytes: this.MAX_LOCAL_BYTES,
       indexed_frameworks: this.getIndexedFrameworkCount(),
       ttl_strategies: { ...CacheTTL },
     };
@@ -203,33 +496,37 @@ export class KVCache {
   /**
    * Get framework cache info
    */
-  async getFrameworkCacheInfo(framework: string): Promise<{
-    framework: string;
-    memory_entries: number;
-    total_size_bytes: number;
-    last_cached_at: number | null;
-  }> {
-    let memoryEntries = 0;
-    let totalSize = 0;
-    let lastCachedAt: number | null = null;
-
-    for (const [key, entry] of this.localCache.entries()) {
-      if (entry.framework === framework) {
-        memoryEntries++;
-        totalSize += entry.content.length;
-        // Track the most recent cache timestamp for this framework
-        if (lastCachedAt === null || entry.cached_at > lastCachedAt) {
-          lastCachedAt = entry.cached_at;
+  async getFrameworkCacheInfo(framework: string): Promise<FrameworkCacheInfo> {
+    return this.getFrameworksCacheInfo([framework])[0];
+  }
+
+  /**
+   * Get cache info for several frameworks, in the given order, from a single pass
+   * over the local cache rather than one pass per framework
+   */
+  getFrameworksCacheInfo(frameworks: string[]): FrameworkCacheInfo[] {
+    const infos = new Map<string, FrameworkCacheInfo>();
+    for (const framework of frameworks) {
+      infos.set(framework, {
+        framework,
+        memory_entries: 0,
+        total_size_bytes: 0,
+        last_cached_at: null,
+      });
+    }
+
+    for (const local of this.localCache.values()) {
+      const info = infos.get(local.framework);
+      if (info) {
+        info.memory_entries++;
+        info.total_size_bytes += local.size;
+        if (info.last_cached_at === null || local.cachedAt > info.last_cached_at) {
+          info.last_cached_at = local.cachedAt;
         }
       }
     }
 
-    return {
-      framework,
-      memory_entries: memoryEntries,
-      total_size_bytes: totalSize,
-      last_cached_at: lastCachedAt,
-    };
+    return frameworks.map((framework) => infos.get(framework)!);
   }
 
   /**
@@ -240,7 +537,7 @@ export class KVCache {
       return { oldest: null, newest: null, all: [] };
     }
 
-    const timestamps = Array.from(this.localCache.values()).map((e) => e.cached_at);
+    const timestamps = Array.from(this.localCache.values()).map((local) => local.cachedAt);
     return {
       oldest: Math.min(...timestamps),
       newest: Math.max(...timestamps),
@@ -248,28 +545,277 @@ export class KVCache {
     };
   }
 
+  /**
+   * Serve a key from the local tier, dropping it if expired
+   */
+  private getLocal(cacheKey: string): string | null {
+    const local = this.localCache.get(cacheKey);
+    if (!local) {
+      return null;
+    }
+
+    if (Date.now() <= local.expiresAt) {
+      if (local.freq < MAX_LOCAL_FREQUENCY) {
+        local.freq++;
+      }
+      return local.content;
+    }
+
+    this.removeFromLocalCache(cacheKey);
+    return null;
+  }
+
+  /**
+   * Decode a record read from Redis and consider it for the local tier
+   */
+  private async acceptRemote(cacheKey: string, stored: CacheEntry | null): Promise<string | null> {
+    if (!stored || this.isExpired(stored)) {
+      return null;
+    }
+
+    // A corrupt record is a miss for its own key only, not for the rest of a batch
+    let entry: CacheEntry;
+    try {
+      entry = await decodeFromRemote(stored);
+    } catch (error) {
+      logger.warn('Redis entry decode error', {
+        key: cacheKey,
+        error: error instanceof Error ? error.message : String(error),
+      });
+      return null;
+    }
+
+    // Promote to local cache unless that would evict a more frequently used entry
+    if (this.shouldPromote(cacheKey, contentSize(entry.content))) {
+      this.addToLocalCache(cacheKey, LocalEntry.fromRecord(entry));
+    }
+    return entry.content;
+  }
+
   private isExpired(entry: CacheEntry): boolean {
-    const now = Date.now();
-    const expiresAt = entry.cached_at + entry.ttl * 1000;
-    return now > expiresAt;
+    // Deadline is precomputed at write time; fall back for entries stored without it
+    return Date.now() > (entry.expires_at ?? entry.cached_at + entry.ttl * 1000);
+  }
+
+  /**
+   * Queue a Redis write; writes queued within the batch window share one pipeline round trip.
+   * Writes can be cancelled by invalidation until their request is sent.
+   */
+  private queueRemoteWrite(write: PendingWrite): Promise<void> {
+    this.pendingWrites.push(write);
+
+    if (!this.pendingFlush) {
+      this.pendingFlush = new Promise((resolve) => {
+        setTimeout(() => {
+          this.flushRemoteWrites().then(resolve, (error) => {
+            logger.warn('Redis write flush failed', {
+              error: error instanceof Error ? error.message : String(error),
+            });
+            resolve();
+          });
+        }, REMOTE_WRITE_BATCH_WINDOW_MS);
+      });
+    }
+
+    return this.pendingFlush;
   }
 
-  private addToLocalCache(key: string, entry: CacheEntry): void {
-    // Remove oldest entries if at capacity
-    while (this.localCache.size >= this.MAX_LOCAL_ENTRIES) {
-      const firstKey = this.localCache.keys().next().value;
-      if (firstKey) {
-        this.localCache.delete(firstKey);
+  /**
+   * Drop queued writes matching the predicate and cancel those still being compressed
+   */
+  private cancelRemoteWrites(matches: (write: PendingWrite) => boolean): void {
+    this.pendingWrites = this.pendingWrites.filter((write) => !matches(write));
+    for (const write of this.flushingWrites) {
+      if (matches(write)) {
+        write.cancelled = true;
+      }
+    }
+  }
+
+  private async flushRemoteWrites(): Promise<void> {
+    // Take the batch up front; writes queued while it compresses start the next flush
+    const batch = this.pendingWrites;
+    this.pendingWrites = [];
+    this.pendingFlush = null;
+
+    if (!this.redis || !batch.length) {
+      return;
+    }
+
+    for (const write of batch) {
+      this.flushingWrites.add(write);
+    }
+
+    const writes: PendingWrite[] = [];
+    try {
+      const records = await Promise.all(batch.map((write) => encodeForRemote(write.entry)));
+      const pipeline = this.redis.pipeline();
+      const tagKeys = new Set<string>();
+
+      batch.forEach((write, i) => {
+        if (write.cancelled) {
+          return;
+        }
+        // Index the key under its framework tag so clearFramework needn't scan the keyspace
+        const { cacheKey, entry, ttl } = write;
+        const tagKey = generateFrameworkTagKey(entry.framework);
+        pipeline.set(cacheKey, records[i], { ex: ttl });
+        pipeline.zadd(tagKey, {
+          score: entry.expires_at ?? entry.cached_at + ttl * 1000,
+          member: cacheKey,
+        });
+        tagKeys.add(tagKey);
+        writes.push(write);
+      });
+
+      if (!writes.length) {
+        return;
+      }
+
+      // Prune members whose entries have expired by TTL, so the index tracks live keys only
+      const now = Date.now();
+      for (const tagKey of tagKeys) {
+        pipeline.zremrangebyscore(tagKey, '-inf', now);
+        pipeline.expire(tagKey, CacheTTL.stable);
+      }
+
+      await pipeline.exec();
+      if (logger.isDebugEnabled()) {
+        logger.debug('Content cached', {
+          entries: writes.length,
+          keys: writes.map((write) => write.cacheKey),
+        });
       }
+    } catch (error) {
+      logger.warn('Redis set error', {
+        keys: (writes.length ? writes : batch).map((write) => write.cacheKey),
+        error: error instanceof Error ? error.message : String(error),
+      });
+    } finally {
+      for (const write of batch) {
+        this.flushingWrites.delete(write);
+      }
+    }
+  }
+
+  /**
+   * TinyLFU admission: with room to spare always promote; otherwise only when the
+   * candidate has been requested more often than the next entry in line for eviction
+   */
+  private shouldPromote(key: string, size: number): boolean {
+    if (
+      this.localCache.size < this.MAX_LOCAL_ENTRIES &&
+      this.localBytes + size <= this.MAX_LOCAL_BYTES
+    ) {
+      return true;
+    }
+
+    const victimQueue =
+      this.smallQueue.size > this.SMALL_QUEUE_TARGET || this.mainQueue.size === 0
+        ? this.smallQueue
+        : this.mainQueue;
+    const victimKey = victimQueue.values().next().value;
+    if (victimKey === undefined) {
+      return true;
+    }
+
+    return this.frequencySketch.estimate(key) > this.frequencySketch.estimate(victimKey);
+  }
+
+  private addToLocalCache(key: string, local: LocalEntry): void {
+    // Replacing a key keeps its queue but must not evict another entry
+    const existing = this.localCache.get(key);
+    this.removeFromLocalCache(key);
+
+    // Entries larger than the whole budget are served from Redis only
+    const size = local.size;
+    if (size > this.MAX_LOCAL_BYTES) {
+      return;
+    }
+
+    while (
+      this.localCache.size > 0 &&
+      (this.localCache.size >= this.MAX_LOCAL_ENTRIES ||
+        this.localBytes + size > this.MAX_LOCAL_BYTES)
+    ) {
+      this.evictLocal();
     }
 
-    this.localCache.set(key, entry);
+    // Keys evicted from probation that come back quickly go straight to the main queue
+    local.inMain = this.ghostKeys.delete(key) || Boolean(existing?.inMain);
+    this.localCache.set(key, local);
+    (local.inMain ? this.mainQueue : this.smallQueue).add(key);
+    this.localBytes += size;
+  }
+
+  /**
+   * Evict from the small queue while it is over its share, otherwise from the main queue
+   */
+  private evictLocal(): void {
+    if (this.smallQueue.size > this.SMALL_QUEUE_TARGET || this.mainQueue.size === 0) {
+      this.evictFromSmallQueue();
+    } else {
+      this.evictFromMainQueue();
+    }
+  }
+
+  private evictFromSmallQueue(): void {
+    const key = this.smallQueue.values().next().value;
+    if (key === undefined) return;
+
+    this.smallQueue.delete(key);
+    const local = this.localCache.get(key)!;
+
+    if (local.freq > 0) {
+      // Hit during probation: move to the main queue
+      local.freq = 0;
+      local.inMain = true;
+      this.mainQueue.add(key);
+      return;
+    }
+
+    this.dropLocalEntry(key, local);
+    this.ghostKeys.add(key);
+    if (this.ghostKeys.size > this.MAX_LOCAL_ENTRIES) {
+      const oldestGhost = this.ghostKeys.values().next().value;
+      if (oldestGhost !== undefined) this.ghostKeys.delete(oldestGhost);
+    }
+  }
+
+  private evictFromMainQueue(): void {
+    const key = this.mainQueue.values().next().value;
+    if (key === undefined) return;
+
+    this.mainQueue.delete(key);
+    const local = this.localCache.get(key)!;
+
+    if (local.freq > 0) {
+      // Recently used: give it another pass through the queue
+      local.freq--;
+      this.mainQueue.add(key);
+      return;
+    }
+
+    this.dropLocalEntry(key, local);
+  }
+
+  private removeFromLocalCache(key: string): void {
+    const local = this.localCache.get(key);
+    if (local) {
+      (local.inMain ? this.mainQueue : this.smallQueue).delete(key);
+      this.dropLocalEntry(key, local);
+    }
+  }
+
+  private dropLocalEntry(key: string, local: LocalEntry): void {
+    this.localCache.delete(key);
+    this.localBytes -= local.size;
   }
 
   private getIndexedFrameworkCount(): number {
     const frameworks = new Set<string>();
-    for (const entry of this.localCache.values()) {
-      frameworks.add(entry.framework);
+    for (const local of this.localCache.values()) {
+      frameworks.add(local.framework);
     }
     return frameworks.size;
   }
@@ -56,8 +56,27 @@ export function generateCacheKey(
   path: string = '',
   sourceType: string = 'docs'
 ): string {
-  // Create a consistent key format
-  const normalizedPath = path.replace(/\//g, ':').toLowerCase();
-  const key = `augments:${sourceType}:${framework}:${normalizedPath || 'main'}`;
-  return key;
+  // Keys are plain strings (no hashing); most lookups have no path and skip normalization
+  if (!path) {
+    return `augments:${sourceType}:${framework}:main`;
+  }
+
+  const normalizedPath = path.replaceAll('/', ':').toLowerCase();
+  return `augments:${sourceType}:${framework}:${normalizedPath}`;
+}
+
+/**
+ * Cache path of a framework's examples, optionally narrowed by pattern.
+ * Shared by every reader and writer so they all address the same entry.
+ */
+export function generateExamplesCachePath(pattern?: string): string {
+  return `examples:${pattern || 'general'}`;
+}
+
+/**
+ * Key of the Redis sorted set indexing every cache key stored for a framework,
+ * scored by each entry's expiry so stale members can be pruned by score
+ */
+export function generateFrameworkTagKey(framework: string): string {
+  return `augments:keys:${framework}`;
 }
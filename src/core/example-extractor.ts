@@ -258,6 +258,94 @@ const CONCEPT_TO_DOC_PATHS: Record<string, Record<string, string[]>> = {
   },
 };
 
+/**
+ * Built-in and framework type names that are not worth tagging as concepts
+ */
+const BUILT_IN_TYPES = new Set([
+  'Array',
+  'String',
+  'Number',
+  'Boolean',
+  'Object',
+  'Function',
+  'Promise',
+  'Error',
+  'Date',
+  'Map',
+  'Set',
+  'Symbol',
+  'RegExp',
+  'JSON',
+  'Math',
+  'Intl',
+  'React',
+  'Component',
+  'Fragment',
+  'Suspense',
+  'HTMLElement',
+  'Element',
+  'Node',
+  'Document',
+  'Window',
+]);
+
+/**
+ * Common short-lived variable names that are not worth tagging as concepts
+ */
+const INSIGNIFICANT_NAMES = new Set([
+  'i',
+  'j',
+  'k',
+  'x',
+  'y',
+  'z',
+  'n',
+  'a',
+  'b',
+  'c',
+  'el',
+  'fn',
+  'cb',
+  'err',
+  'res',
+  'req',
+  'ctx',
+  'val',
+  'key',
+  'tmp',
+  'temp',
+  'data',
+  'item',
+  'value',
+  'result',
+  'response',
+  'error',
+  'index',
+  'count',
+]);
+
+/**
+ * Canonical names for code fence language identifiers
+ */
+const LANGUAGE_ALIASES: Record<string, string> = {
+  js: 'javascript',
+  ts: 'typescript',
+  jsx: 'jsx',
+  tsx: 'tsx',
+  json: 'json',
+  bash: 'bash',
+  sh: 'bash',
+  shell: 'bash',
+  css: 'css',
+  html: 'html',
+  md: 'markdown',
+  markdown: 'markdown',
+  sql: 'sql',
+  prisma: 'prisma',
+  graphql: 'graphql',
+  gql: 'graphql',
+};
+
 /**
  * Code example extractor for finding and parsing examples
  */
@@ -616,25 +704,7 @@ export class ExampleExtractor {
    */
   private normalizeLanguage(lang: string): string {
     const normalized = lang.toLowerCase();
-    const aliases: Record<string, string> = {
-      js: 'javascript',
-      ts: 'typescript',
-      jsx: 'jsx',
-      tsx: 'tsx',
-      json: 'json',
-      bash: 'bash',
-      sh: 'bash',
-      shell: 'bash',
-      css: 'css',
-      html: 'html',
-      md: 'markdown',
-      markdown: 'markdown',
-      sql: 'sql',
-      prisma: 'prisma',
-      graphql: 'graphql',
-      gql: 'graphql',
-    };
-    return aliases[normalized] || normalized;
+    return LANGUAGE_ALIASES[normalized] || normalized;
   }
 
   /**
@@ -661,34 +731,7 @@ export class ExampleExtractor {
    * Check if a type name is a built-in
    */
   private isBuiltInType(name: string): boolean {
-    const builtIns = new Set([
-      'Array',
-      'String',
-      'Number',
-      'Boolean',
-      'Object',
-      'Function',
-      'Promise',
-      'Error',
-      'Date',
-      'Map',
-      'Set',
-      'Symbol',
-      'RegExp',
-      'JSON',
-      'Math',
-      'Intl',
-      'React',
-      'Component',
-      'Fragment',
-      'Suspense',
-      'HTMLElement',
-      'Element',
-      'Node',
-      'Document',
-      'Window',
-    ]);
-    return builtIns.has(name);
+    return BUILT_IN_TYPES.has(name);
   }
 
   /**
@@ -696,38 +739,7 @@ export class ExampleExtractor {
    */
   private isSignificantName(name: string): boolean {
     // Skip short names and common variable names
-    const insignificant = new Set([
-      'i',
-      'j',
-      'k',
-      'x',
-      'y',
-      'z',
-      'n',
-      'a',
-      'b',
-      'c',
-      'el',
-      'fn',
-      'cb',
-      'err',
-      'res',
-      'req',
-      'ctx',
-      'val',
-      'key',
-      'tmp',
-      'temp',
-      'data',
-      'item',
-      'value',
-      'result',
-      'response',
-      'error',
-      'index',
-      'count',
-    ]);
-    return name.length >= 3 && !insignificant.has(name.toLowerCase());
+    return name.length >= 3 && !INSIGNIFICANT_NAMES.has(name.toLowerCase());
   }
 
   /**
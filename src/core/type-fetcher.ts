@@ -569,18 +569,22 @@ export class TypeFetcher {
     packageName: string,
     version?: string
   ): Promise<TypeDefinitionResult[]> {
+    // For some packages, fetch additional type files alongside the main types.
+    // Package info lookups are deduplicated, so the requests share one registry fetch.
+    const additionalFiles = await this.getAdditionalTypeFiles(packageName, version);
+    const [mainTypes, ...additionalTypes] = await Promise.all([
+      this.fetchTypes(packageName, version),
+      ...additionalFiles.map((filePath) =>
+        this.fetchSpecificTypeFile(packageName, version, filePath)
+      ),
+    ]);
+
+    // Keep the main types first, then additional files in list order
     const results: TypeDefinitionResult[] = [];
-
-    // Get main types
-    const mainTypes = await this.fetchTypes(packageName, version);
     if (mainTypes) {
       results.push(mainTypes);
     }
-
-    // For some packages, fetch additional type files
-    const additionalFiles = await this.getAdditionalTypeFiles(packageName, version);
-    for (const filePath of additionalFiles) {
-      const result = await this.fetchSpecificTypeFile(packageName, version, filePath);
+    for (const result of additionalTypes) {
       if (result) {
         results.push(result);
       }
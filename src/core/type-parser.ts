@@ -5,7 +5,7 @@
  * Given a concept (e.g., "useEffect"), finds its signature and resolves type references.
  *
  * Features:
- * - AST parse caching (djb2 hash-based, max 50 entries)
+ * - AST parse caching (keyed by content, max 50 entries)
  * - Enhanced JSDoc extraction (@param, @returns, @example, @deprecated, @see)
  * - Smart response filtering with maxResults and scoring
  */
@@ -79,23 +79,15 @@ export interface ApiSignature {
   deprecatedMessage?: string;
 }
 
-/**
- * djb2 hash function for fast content hashing
- */
-function djb2Hash(str: string): number {
-  let hash = 5381;
-  for (let i = 0; i < str.length; i++) {
-    hash = ((hash << 5) + hash + str.charCodeAt(i)) | 0;
-  }
-  return hash >>> 0; // Convert to unsigned
-}
-
 /**
  * TypeScript parser for extracting API signatures from .d.ts content
  */
 export class TypeParser {
   private printer: ts.Printer;
-  private parseCache: Map<number, ParseResult> = new Map();
+  // Keyed by the content itself: the engine hashes a string once and caches the hash on it,
+  // so re-parsing the same fetched content skips a JS-level pass, and keys can't collide.
+  // The strings are usually the same objects the type fetcher already caches.
+  private parseCache: Map<string, ParseResult> = new Map();
   private readonly MAX_PARSE_CACHE_SIZE = 50;
 
   constructor() {
@@ -107,14 +99,13 @@ export class TypeParser {
 
   /**
    * Parse TypeScript definition content and extract all type definitions.
-   * Results are cached based on content hash.
+   * Results are cached by content.
    */
   parse(content: string, fileName: string = 'types.d.ts'): ParseResult {
     // Check parse cache
-    const contentHash = djb2Hash(content);
-    const cached = this.parseCache.get(contentHash);
+    const cached = this.parseCache.get(content);
     if (cached) {
-      logger.debug('Parse cache hit', { fileName, hash: contentHash });
+      logger.debug('Parse cache hit', { fileName, length: content.length });
       return cached;
     }
 
@@ -166,7 +157,7 @@ export class TypeParser {
         this.parseCache.delete(firstKey);
       }
     }
-    this.parseCache.set(contentHash, result);
+    this.parseCache.set(content, result);
 
     logger.debug('Parsed type definitions', {
       fileName,
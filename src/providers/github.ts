@@ -2,12 +2,119 @@
  * GitHub documentation provider
  */
 
-import { GitHubClient, getGitHubClient } from '@/utils/github-client';
+import { GitHubClient, getGitHubClient, type DirectoryEntry } from '@/utils/github-client';
 import { cleanMarkdown } from '@/utils/html-parser';
 import { getLogger } from '@/utils/logger';
 
 const logger = getLogger('github-provider');
 
+/**
+ * Files larger than this are skipped before their content is fetched (1 MiB)
+ */
+const MAX_FILE_SIZE = 1024 * 1024;
+
+/**
+ * Maximum number of file fetches in flight at once for a single provider call
+ */
+const MAX_CONCURRENT_FETCHES = 6;
+
+/**
+ * Like Promise.allSettled over items.map(fn), but with at most `limit` calls in flight
+ */
+async function settleWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<PromiseSettledResult<R>[]> {
+  const results: PromiseSettledResult<R>[] = new Array(items.length);
+  let next = 0;
+
+  const worker = async (): Promise<void> => {
+    while (next < items.length) {
+      const index = next++;
+      try {
+        results[index] = { status: 'fulfilled', value: await fn(items[index]) };
+      } catch (reason) {
+        results[index] = { status: 'rejected', reason };
+      }
+    }
+  };
+
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+/**
+ * Log every rejected file fetch and rethrow the first failure. Missing files resolve to null,
+ * so a rejection is a real error (5xx, rate limit) and combined output would be incomplete.
+ */
+function throwIfAnyRejected(
+  results: PromiseSettledResult<unknown>[],
+  files: Array<{ path: string }>,
+  repo: string
+): void {
+  const rejected = results.flatMap((result, index) =>
+    result.status === 'rejected' ? [{ path: files[index].path, reason: result.reason }] : []
+  );
+
+  for (const { path, reason } of rejected) {
+    logger.warn('GitHub file fetch failed', {
+      repo,
+      path,
+      error: reason instanceof Error ? reason.message : String(reason),
+    });
+  }
+
+  if (rejected.length) {
+    throw rejected[0].reason;
+  }
+}
+
+/**
+ * Documentation files placed first when combining a docs directory, in rank order
+ */
+const PRIORITY_DOC_FILES = ['README.md', 'index.md', 'introduction.md', 'getting-started.md'];
+const PRIORITY_DOC_RANKS = new Map(PRIORITY_DOC_FILES.map((name, rank) => [name, rank]));
+
+/**
+ * Maximum number of non-priority documentation files combined from a directory
+ */
+const MAX_REGULAR_DOC_FILES = 10;
+
+/**
+ * Code fence language for each known source file extension
+ */
+const EXTENSION_LANGUAGES: Record<string, string> = {
+  '.js': 'javascript',
+  '.jsx': 'jsx',
+  '.ts': 'typescript',
+  '.tsx': 'tsx',
+  '.py': 'python',
+  '.java': 'java',
+  '.go': 'go',
+  '.rs': 'rust',
+  '.cpp': 'cpp',
+  '.c': 'c',
+  '.cs': 'csharp',
+  '.php': 'php',
+  '.rb': 'ruby',
+  '.swift': 'swift',
+  '.kt': 'kotlin',
+};
+
+/**
+ * File extensions treated as code examples
+ */
+const CODE_EXTENSIONS = new Set(['.js', '.jsx', '.ts', '.tsx', '.py', '.java', '.go', '.rs', '.cpp', '.c']);
+
+/**
+ * Get the lowercased extension of a file name, including the dot ('' if none)
+ */
+function getExtension(fileName: string): string {
+  const dotIndex = fileName.lastIndexOf('.');
+  return dotIndex === -1 ? '' : fileName.slice(dotIndex).toLowerCase();
+}
+
 export class GitHubProvider {
   private client: GitHubClient;
 
@@ -24,87 +131,86 @@ export class GitHubProvider {
     branch: string = 'main'
   ): Promise<string | null> {
     try {
-      // Try to get the content as a single file first
-      const content = await this.client.getFileContent(repo, path, branch);
-      if (content) {
-        return this.formatSingleFile(content, path);
+      // One request tells a single file apart from a directory
+      const pathContents = await this.client.getPathContents(repo, path, branch);
+      if (pathContents?.type === 'file' && pathContents.content) {
+        return this.formatSingleFile(pathContents.content, path);
       }
 
-      // If not a single file, try to get directory contents
-      const directoryContents = await this.client.getDirectoryContents(repo, path, branch);
+      const directoryContents = pathContents?.type === 'dir' ? pathContents.entries : [];
       if (!directoryContents.length) {
         logger.warn('No documentation found', { repo, path });
         return null;
       }
 
-      // Process multiple files
-      const priorityFiles = ['README.md', 'index.md', 'introduction.md', 'getting-started.md'];
-      const regularFiles: Array<{ name: string; type: string; path: string }> = [];
-      const priorityItems: Array<{ name: string; type: string; path: string; priority: number }> = [];
+      // Process multiple files: priority files first (in rank order), then up to 10 others
+      const priorityItems: Array<DirectoryEntry | undefined> = new Array(PRIORITY_DOC_FILES.length);
+      const regularFiles: DirectoryEntry[] = [];
+      let priorityFound = 0;
 
       for (const item of directoryContents) {
-        if (item.type === 'file' && /\.(md|mdx)$/i.test(item.name)) {
-          const priorityIndex = priorityFiles.indexOf(item.name);
-          if (priorityIndex !== -1) {
-            priorityItems.push({ ...item, priority: priorityIndex });
-          } else {
+        if (
+          item.type === 'file' &&
+          item.size <= MAX_FILE_SIZE &&
+          /\.(md|mdx)$/i.test(item.name)
+        ) {
+          const rank = PRIORITY_DOC_RANKS.get(item.name);
+          if (rank !== undefined) {
+            if (!priorityItems[rank]) priorityFound++;
+            priorityItems[rank] = item;
+          } else if (regularFiles.length < MAX_REGULAR_DOC_FILES) {
             regularFiles.push(item);
           }
+
+          // Stop scanning once every slot is filled
+          if (
+            priorityFound === PRIORITY_DOC_FILES.length &&
+            regularFiles.length === MAX_REGULAR_DOC_FILES
+          ) {
+            break;
+          }
         }
       }
 
-      // Sort priority files and combine with regular files (limit to 10 regular files)
-      priorityItems.sort((a, b) => a.priority - b.priority);
       const allFiles = [
-        ...priorityItems.map((item) => ({
-          name: item.name,
-          type: item.type,
-          path: item.path,
-        })),
-        ...regularFiles.slice(0, 10),
+        ...priorityItems.filter((item): item is DirectoryEntry => item !== undefined),
+        ...regularFiles,
       ];
 
-      // Fetch content for each file
-      const contentParts: string[] = [];
-
-      for (const fileItem of allFiles) {
-        const fileContent = await this.client.getFileContent(
-          repo,
-          fileItem.path,
-          branch
-        );
-
-        if (fileContent) {
-          const formattedContent = this.formatFileContent(
-            fileContent,
-            fileItem.name,
-            fileItem.path
-          );
-          contentParts.push(formattedContent);
+      // Fetch content for all files in parallel, with bounded fan-out
+      const fileContents = await settleWithConcurrency(
+        allFiles,
+        MAX_CONCURRENT_FETCHES,
+        (fileItem) => this.client.getFileContent(repo, fileItem.path, branch)
+      );
+      throwIfAnyRejected(fileContents, allFiles, repo);
+
+      // Append formatted files straight onto the output instead of collecting parts
+      let body = '';
+      let fileCount = 0;
+
+      fileContents.forEach((result, index) => {
+        if (result.status === 'fulfilled' && result.value) {
+          const fileItem = allFiles[index];
+          if (fileCount > 0) body += '\n\n';
+          body += this.formatFileContent(result.value, fileItem.name, fileItem.path);
+          fileCount++;
         }
-      }
+      });
 
-      if (!contentParts.length) {
+      if (!fileCount) {
         logger.warn('No readable documentation files found', { repo, path });
         return null;
       }
 
-      // Combine all parts
-      const header = [
-        `# Documentation from ${repo}`,
-        path !== 'docs' ? `**Path:** ${path}` : '',
-        `**Branch:** ${branch}`,
-        '',
-      ]
-        .filter(Boolean)
-        .join('\n');
-
-      const fullContent = header + '\n\n' + contentParts.join('\n\n');
+      let fullContent = `# Documentation from ${repo}\n`;
+      if (path !== 'docs') fullContent += `**Path:** ${path}\n`;
+      fullContent += `**Branch:** ${branch}\n\n${body}`;
 
       logger.info('GitHub documentation fetched successfully', {
         repo,
         path,
-        files: contentParts.length,
+        files: fileCount,
       });
 
       return fullContent;
@@ -135,18 +241,17 @@ export class GitHubProvider {
       }
 
       // Filter for code files
-      const codeExtensions = ['.js', '.jsx', '.ts', '.tsx', '.py', '.java', '.go', '.rs', '.cpp', '.c'];
       const exampleFiles: Array<{ name: string; path: string }> = [];
+      const patternLower = pattern?.toLowerCase();
 
       for (const item of directoryContents) {
-        if (item.type === 'file') {
-          const isCodeFile = codeExtensions.some((ext) => item.name.toLowerCase().endsWith(ext));
-          if (isCodeFile) {
+        if (item.type === 'file' && item.size <= MAX_FILE_SIZE) {
+          const nameLower = item.name.toLowerCase();
+          if (CODE_EXTENSIONS.has(getExtension(nameLower))) {
             // If pattern is specified, filter by pattern
-            if (pattern) {
-              const patternLower = pattern.toLowerCase();
+            if (patternLower) {
               if (
-                item.name.toLowerCase().includes(patternLower) ||
+                nameLower.includes(patternLower) ||
                 item.path.toLowerCase().includes(patternLower)
               ) {
                 exampleFiles.push({ name: item.name, path: item.path });
@@ -164,39 +269,41 @@ export class GitHubProvider {
 
       // Limit number of files to process
       const filesToProcess = exampleFiles.slice(0, 5);
-      const exampleParts: string[] = [];
-
-      for (const fileItem of filesToProcess) {
-        const fileContent = await this.client.getFileContent(repo, fileItem.path, branch);
-
-        if (fileContent) {
+      const fileContents = await settleWithConcurrency(
+        filesToProcess,
+        MAX_CONCURRENT_FETCHES,
+        (fileItem) => this.client.getFileContent(repo, fileItem.path, branch)
+      );
+      throwIfAnyRejected(fileContents, filesToProcess, repo);
+
+      // Append examples straight onto the output instead of collecting parts
+      let body = '';
+      let fileCount = 0;
+
+      fileContents.forEach((result, index) => {
+        if (result.status === 'fulfilled' && result.value) {
+          const fileItem = filesToProcess[index];
           const language = this.detectLanguage(fileItem.name);
-          exampleParts.push(`### ${fileItem.name}\n\n\`\`\`${language}\n${fileContent}\n\`\`\`\n`);
+          if (fileCount > 0) body += '\n';
+          body += `### ${fileItem.name}\n\n\`\`\`${language}\n${result.value}\n\`\`\`\n`;
+          fileCount++;
         }
-      }
+      });
 
-      if (!exampleParts.length) {
+      if (!fileCount) {
         return null;
       }
 
-      // Combine all examples
-      const header = [
-        `# Examples from ${repo}`,
-        path !== 'examples' ? `**Path:** ${path}` : '',
-        pattern ? `**Pattern:** ${pattern}` : '',
-        `**Branch:** ${branch}`,
-        '',
-      ]
-        .filter(Boolean)
-        .join('\n');
-
-      const fullContent = header + '\n\n' + exampleParts.join('\n');
+      let fullContent = `# Examples from ${repo}\n`;
+      if (path !== 'examples') fullContent += `**Path:** ${path}\n`;
+      if (pattern) fullContent += `**Pattern:** ${pattern}\n`;
+      fullContent += `**Branch:** ${branch}\n\n${body}`;
 
       logger.info('GitHub examples fetched successfully', {
         repo,
         path,
         pattern,
-        files: exampleParts.length,
+        files: fileCount,
       });
 
       return fullContent;
@@ -263,32 +370,7 @@ export class GitHubProvider {
   }
 
   private detectLanguage(filename: string): string {
-    const extMap: Record<string, string> = {
-      '.js': 'javascript',
-      '.jsx': 'jsx',
-      '.ts': 'typescript',
-      '.tsx': 'tsx',
-      '.py': 'python',
-      '.java': 'java',
-      '.go': 'go',
-      '.rs': 'rust',
-      '.cpp': 'cpp',
-      '.c': 'c',
-      '.cs': 'csharp',
-      '.php': 'php',
-      '.rb': 'ruby',
-      '.swift': 'swift',
-      '.kt': 'kotlin',
-    };
-
-    const lowerFilename = filename.toLowerCase();
-    for (const [ext, lang] of Object.entries(extMap)) {
-      if (lowerFilename.endsWith(ext)) {
-        return lang;
-      }
-    }
-
-    return 'text';
+    return EXTENSION_LANGUAGES[getExtension(filename)] ?? 'text';
   }
 }
 
@@ -72,23 +72,40 @@ export class FrameworkRegistryManager {
    * Recursively load framework configs from directory
    */
   private async loadFrameworksRecursive(dir: string): Promise<void> {
+    const configs = await this.readFrameworkConfigs(dir);
+
+    // Register in directory order so registry ordering stays deterministic
+    for (const config of configs) {
+      this.frameworks.set(config.name, config);
+    }
+  }
+
+  /**
+   * Read all framework configs under a directory, issuing reads concurrently
+   */
+  private async readFrameworkConfigs(dir: string): Promise<FrameworkConfig[]> {
     try {
       const entries = await fs.readdir(dir, { withFileTypes: true });
 
-      for (const entry of entries) {
+      const pending = entries.map((entry): Promise<FrameworkConfig[]> => {
         const fullPath = path.join(dir, entry.name);
 
         if (entry.isDirectory()) {
-          await this.loadFrameworksRecursive(fullPath);
-        } else if (entry.name.endsWith('.json')) {
-          await this.loadFrameworkConfig(fullPath);
+          return this.readFrameworkConfigs(fullPath);
         }
-      }
+        if (entry.name.endsWith('.json')) {
+          return this.loadFrameworkConfig(fullPath).then((config) => (config ? [config] : []));
+        }
+        return Promise.resolve([]);
+      });
+
+      return (await Promise.all(pending)).flat();
     } catch (error) {
       logger.warn('Failed to read directory', {
         dir,
         error: error instanceof Error ? error.message : String(error),
       });
+      return [];
     }
   }
 
@@ -106,7 +123,6 @@ export class FrameworkRegistryManager {
         return null;
       }
 
-      this.frameworks.set(config.name, config);
       logger.debug('Loaded framework configuration', {
         framework: config.name,
         category: config.category,
@@ -6,9 +6,10 @@
 
 import { z } from 'zod';
 import { FrameworkRegistryManager } from '@/registry/manager';
-import { KVCache } from '@/cache';
+import { KVCache, generateExamplesCachePath } from '@/cache';
 import { GitHubProvider } from '@/providers/github';
 import { WebsiteProvider } from '@/providers/website';
+import { fetchFrameworkDocs, fetchFrameworkExamples } from './documentation';
 import { GitHubClient, getGitHubClient, RateLimitError } from '@/utils/github-client';
 import { type CacheStats } from '@/types';
 import { getLogger } from '@/utils/logger';
@@ -245,17 +246,8 @@ export async function getCacheStats(
     // Get overall cache stats
     const overallStats = cache.getStats();
 
-    // Get per-framework stats
-    const frameworkStats: Array<{
-      framework: string;
-      memory_entries: number;
-      total_size_bytes: number;
-    }> = [];
-
-    for (const frameworkName of registry.getFrameworkNames()) {
-      const fwStats = await cache.getFrameworkCacheInfo(frameworkName);
-      frameworkStats.push(fwStats);
-    }
+    // Get per-framework stats in one pass over the cache
+    const frameworkStats = cache.getFrameworksCacheInfo(registry.getFrameworkNames());
 
     // Calculate totals
     const totalMemorySize = frameworkStats.reduce((sum, fw) => sum + fw.total_size_bytes, 0);
@@ -467,54 +459,28 @@ async function refreshSingleFramework(
   // Refresh documentation
   const docSource = config.sources.documentation;
 
-  if (docSource.github) {
+  if (docSource.github || docSource.website) {
     try {
-      // Invalidate existing cache
+      // Invalidate existing cache, including the per-source entry older refreshes wrote
       await cache.invalidate(framework, '', 'docs');
-
-      // Fetch fresh content
-      const freshContent = await githubProvider.fetchDocumentation(
-        docSource.github.repo,
-        docSource.github.docs_path,
-        docSource.github.branch
-      );
-
-      if (freshContent) {
-        await cache.set(
-          framework,
-          freshContent,
-          '',
-          'docs',
-          config.version,
-          docSource.github.branch
-        );
-        refreshCount++;
-      }
-    } catch (error) {
-      logger.warn('GitHub cache refresh failed', {
-        framework,
-        repo: docSource.github.repo,
-        error: error instanceof Error ? error.message : String(error),
-      });
-    }
-  }
-
-  if (docSource.website) {
-    try {
-      // Invalidate existing cache
       await cache.invalidate(framework, 'website', 'docs');
 
-      // Fetch fresh content
-      const freshContent = await websiteProvider.fetchDocumentation(docSource.website);
+      // Rebuild the entry exactly as the docs tool would, so it serves the same format
+      const freshDocs = await fetchFrameworkDocs(
+        framework,
+        undefined,
+        config,
+        githubProvider,
+        websiteProvider
+      );
 
-      if (freshContent) {
-        await cache.set(framework, freshContent, 'website', 'docs', config.version);
+      if (freshDocs) {
+        await cache.set(framework, freshDocs, '', 'docs', config.version);
         refreshCount++;
       }
     } catch (error) {
-      logger.warn('Website cache refresh failed', {
+      logger.warn('Documentation cache refresh failed', {
         framework,
-        url: docSource.website,
         error: error instanceof Error ? error.message : String(error),
       });
     }
@@ -523,23 +489,21 @@ async function refreshSingleFramework(
   // Refresh examples if available
   if (config.sources.examples?.github) {
     try {
-      await cache.invalidate(framework, '', 'examples');
-
-      const freshExamples = await githubProvider.fetchExamples(
-        config.sources.examples.github.repo,
-        config.sources.examples.github.docs_path,
-        config.sources.examples.github.branch
+      const examplesPath = generateExamplesCachePath();
+      await cache.invalidate(framework, examplesPath, 'examples');
+
+      // Rebuild the entry exactly as the examples tool would, so it serves the same format
+      const freshExamples = await fetchFrameworkExamples(
+        registry,
+        cache,
+        githubProvider,
+        websiteProvider,
+        framework,
+        config
       );
 
       if (freshExamples) {
-        await cache.set(
-          framework,
-          freshExamples,
-          'examples',
-          'examples',
-          config.version,
-          config.sources.examples.github.branch
-        );
+        await cache.set(framework, freshExamples, examplesPath, 'examples', config.version);
         refreshCount++;
       }
     } catch (error) {
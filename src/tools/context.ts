@@ -79,6 +79,9 @@ export async function getFrameworkContext(
       documentation_snippets: Array<{ section: string; content: string }>;
     }> = [];
 
+    // Documentation sections to look up for each context, read in one batch below
+    const sectionLookups: Array<{ contextIndex: number; section: string }> = [];
+
     for (const framework of validFrameworks) {
       const config = registry.getFramework(framework)!;
 
@@ -98,29 +101,34 @@ export async function getFrameworkContext(
 
       // Get documentation snippets for relevant sections (limit to top 3)
       for (const section of relevantSections.slice(0, 3)) {
-        try {
-          const cachedContent = await cache.get(framework, section, 'docs');
-          if (cachedContent) {
-            const snippet = extractRelevantSnippet(cachedContent, taskKeywords, section);
-            if (snippet) {
-              frameworkContext.documentation_snippets.push({
-                section,
-                content: snippet,
-              });
-            }
-          }
-        } catch (error) {
-          logger.warn('Failed to get documentation snippet', {
-            framework,
-            section,
-            error: error instanceof Error ? error.message : String(error),
-          });
-        }
+        sectionLookups.push({ contextIndex: frameworkContexts.length, section });
       }
 
       frameworkContexts.push(frameworkContext);
     }
 
+    // Read every framework's sections from the cache in one batch
+    const cachedSections = await cache.getMany(
+      sectionLookups.map(({ contextIndex, section }) => ({
+        framework: frameworkContexts[contextIndex].framework,
+        path: section,
+        sourceType: 'docs',
+      }))
+    );
+
+    cachedSections.forEach((content, index) => {
+      if (content) {
+        const { contextIndex, section } = sectionLookups[index];
+        const snippet = extractRelevantSnippet(content, taskKeywords, section);
+        if (snippet) {
+          frameworkContexts[contextIndex].documentation_snippets.push({
+            section,
+            content: snippet,
+          });
+        }
+      }
+    });
+
     // Generate compatibility insights
     const compatibilityInsights = generateCompatibilityInsights(
       validFrameworks,
@@ -6,10 +6,10 @@
 
 import { z } from 'zod';
 import { FrameworkRegistryManager } from '@/registry/manager';
-import { KVCache } from '@/cache';
+import { KVCache, generateExamplesCachePath } from '@/cache';
 import { GitHubProvider } from '@/providers/github';
 import { WebsiteProvider } from '@/providers/website';
-import { type DocSearchResult } from '@/types';
+import { type DocSearchResult, type FrameworkConfig } from '@/types';
 import { getLogger } from '@/utils/logger';
 
 const logger = getLogger('tools:documentation');
@@ -57,102 +57,19 @@ export async function getFrameworkDocs(
       return `Error: ${errorMsg}`;
     }
 
-    // Try cache first
-    if (use_cache) {
-      const cachedContent = await cache.get(framework, section || '', 'docs');
-      if (cachedContent) {
-        logger.debug('Documentation retrieved from cache', { framework });
-        return cachedContent;
-      }
-    }
-
-    // Fetch from sources
-    const documentationParts: Array<{
-      source: string;
-      repo?: string;
-      url?: string;
-      content: string;
-    }> = [];
-
-    // Try GitHub source first
-    const docSource = config.sources.documentation;
-    if (docSource.github) {
-      try {
-        const githubContent = await githubProvider.fetchDocumentation(
-          docSource.github.repo,
-          section || docSource.github.docs_path,
-          docSource.github.branch
-        );
-
-        if (githubContent) {
-          documentationParts.push({
-            source: 'GitHub',
-            repo: docSource.github.repo,
-            content: githubContent,
-          });
-        }
-      } catch (error) {
-        logger.warn('GitHub fetch failed', {
-          framework,
-          error: error instanceof Error ? error.message : String(error),
-        });
-      }
-    }
-
-    // Try website source if GitHub didn't work or as supplement
-    if (docSource.website && (!documentationParts.length || section)) {
-      try {
-        let websiteUrl = docSource.website;
-        if (section) {
-          // Check if framework has section mappings
-          const sectionPath = config.sections?.[section] || section;
-          websiteUrl = websiteUrl.endsWith('/')
-            ? `${websiteUrl}${sectionPath}`
-            : `${websiteUrl}/${sectionPath}`;
-        }
-
-        const websiteContent = await websiteProvider.fetchDocumentation(websiteUrl);
-        if (websiteContent) {
-          documentationParts.push({
-            source: 'Website',
-            url: websiteUrl,
-            content: websiteContent,
-          });
-        }
-      } catch (error) {
-        logger.warn('Website fetch failed', {
-          framework,
-          error: error instanceof Error ? error.message : String(error),
-        });
-      }
-    }
+    // Concurrent cache misses for the same docs share one fetch
+    const fetchDocs = () =>
+      fetchFrameworkDocs(framework, section, config, githubProvider, websiteProvider);
+    const formattedDocs = use_cache
+      ? await cache.getOrSet(framework, section || '', 'docs', config.version, fetchDocs)
+      : await fetchDocs();
 
-    if (!documentationParts.length) {
+    if (!formattedDocs) {
       const errorMsg = `No documentation found for ${framework}${section ? ` (section: ${section})` : ''}`;
       logger.warn(errorMsg);
       return `Error: ${errorMsg}`;
     }
 
-    // Format the documentation
-    const formattedDocs = formatDocumentation(framework, documentationParts, config);
-
-    // Cache the result
-    if (use_cache && formattedDocs) {
-      await cache.set(
-        framework,
-        formattedDocs,
-        section || '',
-        'docs',
-        config.version
-      );
-    }
-
-    logger.info('Documentation retrieved', {
-      framework,
-      section,
-      sources: documentationParts.length,
-    });
-
     return formattedDocs;
   } catch (error) {
     const errorMsg = `Failed to retrieve documentation for ${input.framework}: ${error instanceof Error ? error.message : String(error)}`;
@@ -187,151 +104,32 @@ export async function getFrameworkExamples(
     }
 
     // Check cache first
-    const cacheKeySuffix = `examples:${pattern || 'general'}`;
+    const cacheKeySuffix = generateExamplesCachePath(pattern);
     const cachedContent = await cache.get(framework, cacheKeySuffix, 'examples');
     if (cachedContent) {
       logger.debug('Examples retrieved from cache', { framework });
       return cachedContent;
     }
 
-    const examplesParts: Array<{
-      source: string;
-      repo?: string;
-      url?: string;
-      path?: string;
-      content: string;
-    }> = [];
-
-    // Try examples source first
-    if (config.sources.examples) {
-      const examplesSource = config.sources.examples;
-
-      if (examplesSource.github) {
-        try {
-          const examplesPath = pattern || examplesSource.github.docs_path;
-          const githubExamples = await githubProvider.fetchExamples(
-            examplesSource.github.repo,
-            examplesPath,
-            examplesSource.github.branch,
-            pattern
-          );
-
-          if (githubExamples) {
-            examplesParts.push({
-              source: 'GitHub Examples',
-              repo: examplesSource.github.repo,
-              content: githubExamples,
-            });
-          }
-        } catch (error) {
-          logger.warn('GitHub examples fetch failed', {
-            framework,
-            error: error instanceof Error ? error.message : String(error),
-          });
-        }
-      }
-
-      if (examplesSource.website) {
-        try {
-          let websiteUrl = examplesSource.website;
-          if (pattern) {
-            websiteUrl = websiteUrl.endsWith('/')
-              ? `${websiteUrl}${pattern}`
-              : `${websiteUrl}/${pattern}`;
-          }
-
-          const websiteExamples = await websiteProvider.fetchExamples(websiteUrl, pattern);
-          if (websiteExamples) {
-            examplesParts.push({
-              source: 'Website Examples',
-              url: websiteUrl,
-              content: websiteExamples,
-            });
-          }
-        } catch (error) {
-          logger.warn('Website examples fetch failed', {
-            framework,
-            error: error instanceof Error ? error.message : String(error),
-          });
-        }
-      }
-    }
-
-    // Fallback to main documentation source
-    if (!examplesParts.length) {
-      const docSource = config.sources.documentation;
-
-      if (docSource.github) {
-        const examplePaths = ['examples', 'docs/examples', 'samples', 'demos'];
-        const pathsToTry = pattern
-          ? examplePaths.map((p) => `${p}/${pattern}`)
-          : examplePaths;
-
-        for (const examplePath of pathsToTry) {
-          try {
-            const githubExamples = await githubProvider.fetchExamples(
-              docSource.github.repo,
-              examplePath,
-              docSource.github.branch,
-              pattern
-            );
-
-            if (githubExamples) {
-              examplesParts.push({
-                source: 'GitHub Documentation',
-                repo: docSource.github.repo,
-                path: examplePath,
-                content: githubExamples,
-              });
-              break;
-            }
-          } catch {
-            continue;
-          }
-        }
-      }
-    }
-
-    // Try to extract examples from main documentation as last resort
-    if (!examplesParts.length) {
-      const docContent = await getFrameworkDocs(
-        registry,
-        cache,
-        githubProvider,
-        websiteProvider,
-        { framework, section: pattern, use_cache: true }
-      );
-
-      if (docContent && !docContent.startsWith('Error:')) {
-        const extractedExamples = extractExamplesFromDocs(docContent, pattern);
-        if (extractedExamples) {
-          examplesParts.push({
-            source: 'Extracted from Documentation',
-            content: extractedExamples,
-          });
-        }
-      }
-    }
+    // Fetch from the examples sources and format the result
+    const formattedExamples = await fetchFrameworkExamples(
+      registry,
+      cache,
+      githubProvider,
+      websiteProvider,
+      framework,
+      config,
+      pattern
+    );
 
-    if (!examplesParts.length) {
+    if (!formattedExamples) {
       const errorMsg = `No examples found for ${framework}${pattern ? ` (pattern: ${pattern})` : ''}`;
       logger.warn(errorMsg);
       return `Error: ${errorMsg}`;
     }
 
-    // Format the examples
-    const formattedExamples = formatExamples(framework, examplesParts, pattern, config);
-
     // Cache the result
-    if (formattedExamples) {
-      await cache.set(framework, formattedExamples, cacheKeySuffix, 'examples', config.version);
-    }
-
-    logger.info('Examples retrieved', {
-      framework,
-      pattern,
-      sources: examplesParts.length,
-    });
+    await cache.set(framework, formattedExamples, cacheKeySuffix, 'examples', config.version);
 
     return formattedExamples;
   } catch (error) {
@@ -394,8 +192,8 @@ export async function searchDocumentation(
       }
     }
 
-    // Third try: Search examples cache
-    const examplesContent = await cache.get(framework, '', 'examples');
+    // Third try: Search the general examples cache
+    const examplesContent = await cache.get(framework, generateExamplesCachePath(), 'examples');
     if (examplesContent) {
       const results = searchTextContent(examplesContent, query, limit);
       if (results.length > 0) {
@@ -421,6 +219,237 @@ export async function searchDocumentation(
 
 // Helper functions
 
+/**
+ * Fetch examples from the framework's sources, falling back to its documentation,
+ * and format them. Shared by the examples tool and cache refresh so both store the same content.
+ */
+export async function fetchFrameworkExamples(
+  registry: FrameworkRegistryManager,
+  cache: KVCache,
+  githubProvider: GitHubProvider,
+  websiteProvider: WebsiteProvider,
+  framework: string,
+  config: FrameworkConfig,
+  pattern?: string
+): Promise<string | null> {
+  const examplesParts: Array<{
+    source: string;
+    repo?: string;
+    url?: string;
+    path?: string;
+    content: string;
+  }> = [];
+
+  // Try examples source first
+  if (config.sources.examples) {
+    const examplesSource = config.sources.examples;
+
+    if (examplesSource.github) {
+      try {
+        const examplesPath = pattern || examplesSource.github.docs_path;
+        const githubExamples = await githubProvider.fetchExamples(
+          examplesSource.github.repo,
+          examplesPath,
+          examplesSource.github.branch,
+          pattern
+        );
+
+        if (githubExamples) {
+          examplesParts.push({
+            source: 'GitHub Examples',
+            repo: examplesSource.github.repo,
+            content: githubExamples,
+          });
+        }
+      } catch (error) {
+        logger.warn('GitHub examples fetch failed', {
+          framework,
+          error: error instanceof Error ? error.message : String(error),
+        });
+      }
+    }
+
+    if (examplesSource.website) {
+      try {
+        let websiteUrl = examplesSource.website;
+        if (pattern) {
+          websiteUrl = websiteUrl.endsWith('/')
+            ? `${websiteUrl}${pattern}`
+            : `${websiteUrl}/${pattern}`;
+        }
+
+        const websiteExamples = await websiteProvider.fetchExamples(websiteUrl, pattern);
+        if (websiteExamples) {
+          examplesParts.push({
+            source: 'Website Examples',
+            url: websiteUrl,
+            content: websiteExamples,
+          });
+        }
+      } catch (error) {
+        logger.warn('Website examples fetch failed', {
+          framework,
+          error: error instanceof Error ? error.message : String(error),
+        });
+      }
+    }
+  }
+
+  // Fallback to main documentation source
+  if (!examplesParts.length) {
+    const docSource = config.sources.documentation;
+
+    if (docSource.github) {
+      const examplePaths = ['examples', 'docs/examples', 'samples', 'demos'];
+      const pathsToTry = pattern
+        ? examplePaths.map((p) => `${p}/${pattern}`)
+        : examplePaths;
+
+      for (const examplePath of pathsToTry) {
+        try {
+          const githubExamples = await githubProvider.fetchExamples(
+            docSource.github.repo,
+            examplePath,
+            docSource.github.branch,
+            pattern
+          );
+
+          if (githubExamples) {
+            examplesParts.push({
+              source: 'GitHub Documentation',
+              repo: docSource.github.repo,
+              path: examplePath,
+              content: githubExamples,
+            });
+            break;
+          }
+        } catch {
+          continue;
+        }
+      }
+    }
+  }
+
+  // Try to extract examples from main documentation as last resort
+  if (!examplesParts.length) {
+    const docContent = await getFrameworkDocs(
+      registry,
+      cache,
+      githubProvider,
+      websiteProvider,
+      { framework, section: pattern, use_cache: true }
+    );
+
+    if (docContent && !docContent.startsWith('Error:')) {
+      const extractedExamples = extractExamplesFromDocs(docContent, pattern);
+      if (extractedExamples) {
+        examplesParts.push({
+          source: 'Extracted from Documentation',
+          content: extractedExamples,
+        });
+      }
+    }
+  }
+
+  if (!examplesParts.length) {
+    return null;
+  }
+
+  logger.info('Examples retrieved', {
+    framework,
+    pattern,
+    sources: examplesParts.length,
+  });
+
+  return formatExamples(framework, examplesParts, pattern, config);
+}
+
+/**
+ * Fetch documentation from the framework's GitHub and website sources and format it.
+ * Shared by the docs tool and cache refresh so both store the same content.
+ */
+export async function fetchFrameworkDocs(
+  framework: string,
+  section: string | undefined,
+  config: FrameworkConfig,
+  githubProvider: GitHubProvider,
+  websiteProvider: WebsiteProvider
+): Promise<string | null> {
+  // Fetch from sources
+  const documentationParts: Array<{
+    source: string;
+    repo?: string;
+    url?: string;
+    content: string;
+  }> = [];
+
+  // Try GitHub source first
+  const docSource = config.sources.documentation;
+  if (docSource.github) {
+    try {
+      const githubContent = await githubProvider.fetchDocumentation(
+        docSource.github.repo,
+        section || docSource.github.docs_path,
+        docSource.github.branch
+      );
+
+      if (githubContent) {
+        documentationParts.push({
+          source: 'GitHub',
+          repo: docSource.github.repo,
+          content: githubContent,
+        });
+      }
+    } catch (error) {
+      logger.warn('GitHub fetch failed', {
+        framework,
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  }
+
+  // Try website source if GitHub didn't work or as supplement
+  if (docSource.website && (!documentationParts.length || section)) {
+    try {
+      let websiteUrl = docSource.website;
+      if (section) {
+        // Check if framework has section mappings
+        const sectionPath = config.sections?.[section] || section;
+        websiteUrl = websiteUrl.endsWith('/')
+          ? `${websiteUrl}${sectionPath}`
+          : `${websiteUrl}/${sectionPath}`;
+      }
+
+      const websiteContent = await websiteProvider.fetchDocumentation(websiteUrl);
+      if (websiteContent) {
+        documentationParts.push({
+          source: 'Website',
+          url: websiteUrl,
+          content: websiteContent,
+        });
+      }
+    } catch (error) {
+      logger.warn('Website fetch failed', {
+        framework,
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  }
+
+  if (!documentationParts.length) {
+    return null;
+  }
+
+  logger.info('Documentation retrieved', {
+    framework,
+    section,
+    sources: documentationParts.length,
+  });
+
+  // Format the documentation
+  return formatDocumentation(framework, documentationParts, config);
+}
+
 function formatDocumentation(
   framework: string,
   parts: Array<{ source: string; repo?: string; url?: string; content: string }>,
@@ -524,6 +553,12 @@ function extractExamplesFromDocs(docContent: string, pattern?: string): string |
   const examples: string[] = [];
   let exampleIndex = 0;
 
+  // Pattern variants are loop-invariant
+  const patternLower = pattern?.toLowerCase();
+  const patternVariants = patternLower
+    ? [patternLower, patternLower.replace('-', ''), patternLower.replace('_', '')]
+    : [];
+
   for (const match of matches) {
     const codeBlock = match[1].trim();
 
@@ -531,15 +566,10 @@ function extractExamplesFromDocs(docContent: string, pattern?: string): string |
     if (codeBlock.length < 20) continue;
 
     // If pattern is specified, filter relevant examples
-    if (pattern) {
-      const patternLower = pattern.toLowerCase();
+    if (patternLower) {
       const codeLower = codeBlock.toLowerCase();
 
-      if (
-        !codeLower.includes(patternLower) &&
-        !codeLower.includes(patternLower.replace('-', '')) &&
-        !codeLower.includes(patternLower.replace('_', ''))
-      ) {
+      if (!patternVariants.some((variant) => codeLower.includes(variant))) {
         continue;
       }
     }
@@ -556,27 +586,54 @@ function extractExamplesFromDocs(docContent: string, pattern?: string): string |
 function searchTextContent(content: string, query: string, limit: number): DocSearchResult[] {
   if (!content || !query) return [];
 
-  const queryLower = query.toLowerCase();
+  // Split the query once; empty words would match every line
+  const queryWords = query.toLowerCase().split(/\s+/).filter(Boolean);
+  if (!queryWords.length) return [];
+
+  // Lowercase the whole document once and scan it with a single alternation of all words,
+  // rather than testing every word against every line
+  const contentLower = content.toLowerCase();
+  const wordsPattern = new RegExp(queryWords.map(escapeRegExp).join('|'), 'g');
+  let match = wordsPattern.exec(contentLower);
+  if (!match) return [];
+
   const lines = content.split('\n');
+  const linesLower = contentLower.split('\n');
+  const matcher = createRelevanceMatcher(query);
   const results: DocSearchResult[] = [];
 
-  for (let i = 0; i < lines.length; i++) {
-    if (queryLower.split(/\s+/).some((word) => lines[i].toLowerCase().includes(word))) {
-      // Get context around the match
-      const startIdx = Math.max(0, i - 2);
-      const endIdx = Math.min(lines.length, i + 3);
+  // Words never contain whitespace, so a match never spans lines
+  let lineIndex = 0;
+  let lineStart = 0;
 
-      const contextLines = lines.slice(startIdx, endIdx);
-      const context = contextLines.join('\n');
+  while (match) {
+    // Advance to the line containing this match
+    while (match.index > lineStart + linesLower[lineIndex].length) {
+      lineStart += linesLower[lineIndex].length + 1;
+      lineIndex++;
+    }
 
-      results.push({
-        line_number: i + 1,
-        content: context,
-        relevance: calculateRelevance(lines[i], query),
-      });
+    // Get context around the match
+    const startIdx = Math.max(0, lineIndex - 2);
+    const endIdx = Math.min(lines.length, lineIndex + 3);
 
-      if (results.length >= limit) break;
-    }
+    const contextLines = lines.slice(startIdx, endIdx);
+    const context = contextLines.join('\n');
+
+    results.push({
+      line_number: lineIndex + 1,
+      content: context,
+      relevance: calculateRelevance(lines[lineIndex], linesLower[lineIndex], matcher),
+    });
+
+    if (results.length >= limit) break;
+
+    // Resume scanning at the next line; one result per line
+    lineStart += linesLower[lineIndex].length + 1;
+    lineIndex++;
+    if (lineIndex >= lines.length) break;
+    wordsPattern.lastIndex = lineStart;
+    match = wordsPattern.exec(contentLower);
   }
 
   // Sort by relevance
@@ -585,17 +642,44 @@ function searchTextContent(content: string, query: string, limit: number): DocSe
   return results.slice(0, limit);
 }
 
-function calculateRelevance(text: string, query: string): number {
-  const textLower = text.toLowerCase();
+/**
+ * Query-derived state for relevance scoring, built once per search rather than per line
+ */
+interface RelevanceMatcher {
+  queryLower: string;
+  wordBoundaryRe: RegExp;
+}
+
+function escapeRegExp(text: string): string {
+  return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+function createRelevanceMatcher(query: string): RelevanceMatcher {
   const queryLower = query.toLowerCase();
 
+  return {
+    queryLower,
+    wordBoundaryRe: new RegExp(`\\b${escapeRegExp(queryLower)}\\b`),
+  };
+}
+
+function calculateRelevance(text: string, textLower: string, matcher: RelevanceMatcher): number {
+  const { queryLower } = matcher;
+
   // Exact match gets highest score
   if (queryLower === textLower.trim()) {
     return 100;
   }
 
-  // Count occurrences
-  const occurrences = (textLower.match(new RegExp(queryLower.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'), 'g')) || []).length;
+  // Count non-overlapping occurrences
+  let occurrences = 0;
+  for (
+    let pos = textLower.indexOf(queryLower);
+    pos !== -1;
+    pos = textLower.indexOf(queryLower, pos + queryLower.length)
+  ) {
+    occurrences++;
+  }
   if (occurrences === 0) {
     return 0;
   }
@@ -604,7 +688,7 @@ function calculateRelevance(text: string, query: string): number {
   let score = occurrences * 10;
 
   // Boost for word boundaries
-  if (new RegExp(`\\b${queryLower.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')}\\b`).test(textLower)) {
+  if (matcher.wordBoundaryRe.test(textLower)) {
     score += 20;
   }
 
@@ -65,10 +65,12 @@ export interface CacheEntry {
   content: string;
   cached_at: number;
   ttl: number;
+  expires_at?: number; // Epoch ms deadline (cached_at + ttl); absent on entries written by older versions
   version: string;
   framework: string;
   source_type: string;
   content_hash?: string; // SHA-256 hash for change detection when HTTP headers unavailable
+  content_encoding?: 'br'; // Content is brotli-compressed and base64-encoded; absent for plain text
 }
 
 // Update status
@@ -115,6 +117,8 @@ export interface CacheStats {
   memory_entries: number;
   memory_max_entries: number;
   memory_utilization_pct: number;
+  memory_bytes: number;
+  memory_max_bytes: number;
   indexed_frameworks: number;
   ttl_strategies: Record<string, number>;
 }
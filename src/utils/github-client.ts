@@ -4,10 +4,14 @@
 
 import { Octokit } from '@octokit/rest';
 import { config } from '@/config';
+import { UnifiedCache } from '@/cache/unified-cache';
 import { getLogger } from '@/utils/logger';
 
 const logger = getLogger('github-client');
 
+// Shared decoder for raw bodies delivered as bytes; invalid UTF-8 becomes U+FFFD instead of failing
+const utf8Decoder = new TextDecoder('utf-8');
+
 /**
  * Parsed repository information
  */
@@ -45,6 +49,43 @@ function getErrorMessage(error: unknown): string {
   return String(error);
 }
 
+/**
+ * Entry in a repository directory listing
+ */
+export interface DirectoryEntry {
+  name: string;
+  type: string;
+  path: string;
+  size: number;
+}
+
+/**
+ * Contents of a repository path: a file body or a directory listing
+ */
+export type PathContents =
+  | { type: 'file'; content: string }
+  | { type: 'dir'; entries: DirectoryEntry[] };
+
+/**
+ * Keep only the listing fields callers use
+ */
+function toDirectoryEntries(items: DirectoryEntry[]): DirectoryEntry[] {
+  return items.map((item) => ({
+    name: item.name,
+    type: item.type,
+    path: item.path,
+    size: item.size,
+  }));
+}
+
+/**
+ * Contents API response remembered for conditional revalidation
+ */
+interface CachedContent {
+  etag: string;
+  data: unknown;
+}
+
 export class RateLimitError extends Error {
   public readonly resetTime: Date;
   public readonly waitSeconds: number;
@@ -62,6 +103,12 @@ export class GitHubClient {
   private rateLimitRemaining: number = 5000;
   private rateLimitReset: Date = new Date();
   private lastRequestTime: Date = new Date();
+  // Unchanged paths are revalidated with If-None-Match; 304s don't count against the rate limit
+  private contentCache = new UnifiedCache<CachedContent>({
+    maxSize: 64,
+    defaultTTL: 60 * 60 * 1000,
+    name: 'github-content',
+  });
 
   constructor(token?: string) {
     this.octokit = new Octokit({
@@ -88,17 +135,11 @@ export class GitHubClient {
     try {
       await this.checkRateLimit();
 
-      const response = await this.octokit.repos.getContent({
-        owner,
-        repo: repoName,
-        path: path.replace(/^\//, ''),
-        ref: branch,
-      });
+      // Raw media type returns the file body directly instead of a base64 JSON envelope
+      const content = await this.getContent(owner, repoName, path, branch, true);
 
-      this.updateRateLimitFromHeaders(response.headers);
-
-      if ('content' in response.data && response.data.type === 'file') {
-        const content = Buffer.from(response.data.content, 'base64').toString('utf-8');
+      // Directories are still returned as a JSON listing
+      if (typeof content === 'string') {
         logger.debug('Retrieved file content', {
           repo,
           path,
@@ -127,6 +168,51 @@ export class GitHubClient {
     }
   }
 
+  /**
+   * Get a file body or directory listing with a single request
+   */
+  async getPathContents(
+    repo: string,
+    path: string,
+    branch: string = 'main'
+  ): Promise<PathContents | null> {
+    const { owner, repoName } = parseRepoString(repo);
+
+    try {
+      await this.checkRateLimit();
+
+      // With the raw media type files come back as their body and directories as a JSON listing
+      const data = await this.getContent(owner, repoName, path, branch, true);
+
+      if (typeof data === 'string') {
+        logger.debug('Retrieved file content', { repo, path, size: data.length });
+        return { type: 'file', content: data };
+      }
+      if (Array.isArray(data)) {
+        logger.debug('Retrieved directory contents', { repo, path, count: data.length });
+        return { type: 'dir', entries: toDirectoryEntries(data) };
+      }
+
+      return null;
+    } catch (error: unknown) {
+      if (isOctokitError(error)) {
+        if (error.status === 404) {
+          logger.debug('Path not found', { repo, path });
+          return null;
+        }
+        if (error.status === 403 && error.message?.includes('rate limit')) {
+          throw new RateLimitError('GitHub API rate limit exceeded');
+        }
+      }
+      logger.error('GitHub getPathContents error', {
+        repo,
+        path,
+        error: getErrorMessage(error),
+      });
+      throw error;
+    }
+  }
+
   /**
    * Get directory contents from a repository
    */
@@ -134,27 +220,16 @@ export class GitHubClient {
     repo: string,
     path: string = '',
     branch: string = 'main'
-  ): Promise<Array<{ name: string; type: string; path: string }>> {
+  ): Promise<DirectoryEntry[]> {
     const { owner, repoName } = parseRepoString(repo);
 
     try {
       await this.checkRateLimit();
 
-      const response = await this.octokit.repos.getContent({
-        owner,
-        repo: repoName,
-        path: path.replace(/^\//, ''),
-        ref: branch,
-      });
-
-      this.updateRateLimitFromHeaders(response.headers);
+      const data = await this.getContent(owner, repoName, path, branch, false);
 
-      if (Array.isArray(response.data)) {
-        const contents = response.data.map((item) => ({
-          name: item.name,
-          type: item.type,
-          path: item.path,
-        }));
+      if (Array.isArray(data)) {
+        const contents = toDirectoryEntries(data);
         logger.debug('Retrieved directory contents', {
           repo,
           path,
@@ -300,6 +375,52 @@ export class GitHubClient {
     };
   }
 
+  /**
+   * Fetch from the contents API, revalidating previously seen paths by ETag
+   */
+  private async getContent(
+    owner: string,
+    repo: string,
+    path: string,
+    ref: string,
+    raw: boolean
+  ): Promise<unknown> {
+    const normalizedPath = path.replace(/^\//, '');
+    const key = `${raw ? 'raw' : 'json'}:${owner}/${repo}@${ref}:${normalizedPath}`;
+    const cached = this.contentCache.get(key);
+
+    try {
+      const response = await this.octokit.repos.getContent({
+        owner,
+        repo,
+        path: normalizedPath,
+        ref,
+        ...(raw && { mediaType: { format: 'raw' } }),
+        headers: cached ? { 'if-none-match': cached.etag } : {},
+      });
+
+      this.updateRateLimitFromHeaders(response.headers);
+
+      // Raw bodies with a non-text content type arrive as bytes; decode them once here
+      const data: unknown =
+        response.data instanceof ArrayBuffer ? utf8Decoder.decode(response.data) : response.data;
+
+      const etag = response.headers.etag;
+      if (etag) {
+        this.contentCache.set(key, { etag, data });
+      }
+
+      return data;
+    } catch (error: unknown) {
+      if (cached && isOctokitError(error) && error.status === 304) {
+        logger.debug('Content not modified', { repo: `${owner}/${repo}`, path });
+        this.contentCache.set(key, cached);
+        return cached.data;
+      }
+      throw error;
+    }
+  }
+
   private async checkRateLimit(): Promise<void> {
     if (this.rateLimitRemaining <= 1 && Date.now() < this.rateLimitReset.getTime()) {
       // Throw immediately instead of blocking - let caller handle the rate limit
@@ -8,6 +8,25 @@ import { getLogger } from '@/utils/logger';
 
 const logger = getLogger('html-parser');
 
+// Markdown cleanup patterns (compiled once at module load)
+const EXCESS_BLANK_LINES_RE = /\n\s*\n\s*\n/g;
+// Linear-time form for text whose line ends are already trimmed (no backtracking over whitespace)
+const EMPTY_LINE_RUN_RE = /\n{3,}/g;
+const RELATIVE_LINK_RE = /\]\(\.\/([^)]+)\)/g;
+
+// Bare class names recognized as code block languages
+const KNOWN_CODE_LANGUAGES = new Set([
+  'javascript',
+  'typescript',
+  'python',
+  'html',
+  'css',
+  'json',
+  'bash',
+  'jsx',
+  'tsx',
+]);
+
 // Initialize Turndown service
 const turndownService = new TurndownService({
   headingStyle: 'atx',
@@ -57,7 +76,7 @@ function detectLanguageFromClass(className: string): string {
     if (cls.startsWith('language-')) {
       return cls.replace('language-', '');
     }
-    if (['javascript', 'typescript', 'python', 'html', 'css', 'json', 'bash', 'jsx', 'tsx'].includes(cls)) {
+    if (KNOWN_CODE_LANGUAGES.has(cls)) {
       return cls;
     }
   }
@@ -153,7 +172,7 @@ export function htmlToMarkdown(html: string, url?: string): string {
     let markdown = turndownService.turndown(mainContent);
 
     // Clean up excessive whitespace
-    markdown = markdown.replace(/\n\s*\n\s*\n/g, '\n\n');
+    markdown = markdown.replace(EXCESS_BLANK_LINES_RE, '\n\n');
 
     // Remove leading/trailing whitespace
     markdown = markdown.trim();
@@ -183,6 +202,7 @@ export function extractCodeExamples(
     const codeBlocks = document.querySelectorAll('pre, code');
 
     let exampleIndex = 0;
+    const patternLower = pattern?.toLowerCase();
 
     codeBlocks.forEach((block) => {
       const codeText = block.textContent?.trim() || '';
@@ -193,8 +213,7 @@ export function extractCodeExamples(
       }
 
       // If pattern is specified, filter by pattern
-      if (pattern) {
-        const patternLower = pattern.toLowerCase();
+      if (patternLower) {
         if (!codeText.toLowerCase().includes(patternLower)) {
           // Check surrounding text for context
           const parentText = block.parentElement?.textContent?.toLowerCase() || '';
@@ -239,26 +258,61 @@ export function extractCodeExamples(
   }
 }
 
+/**
+ * Remove HTML comments with a single forward scan; an unterminated comment is left as-is
+ */
+function stripHtmlComments(content: string): string {
+  let result = '';
+  let pos = 0;
+
+  while (pos < content.length) {
+    const start = content.indexOf('<!--', pos);
+    if (start === -1) break;
+
+    const end = content.indexOf('-->', start + 4);
+    if (end === -1) break;
+
+    result += content.slice(pos, start);
+    pos = end + 3;
+  }
+
+  return result + content.slice(pos);
+}
+
+/**
+ * Remove trailing whitespace from every line
+ */
+function trimLineEnds(content: string): string {
+  return content
+    .split('\n')
+    .map((line) => line.trimEnd())
+    .join('\n');
+}
+
 /**
  * Clean markdown content
  */
 export function cleanMarkdown(content: string): string {
   if (!content) return '';
 
+  // Remove trailing whitespace from lines first so blank runs become plain newlines
+  let cleaned = trimLineEnds(content);
+
+  // Each substitution is gated on a cheap substring check so clean docs skip the regex engine
   // Remove excessive whitespace
-  let cleaned = content.replace(/\n\s*\n\s*\n/g, '\n\n');
+  if (cleaned.includes('\n\n\n')) {
+    cleaned = cleaned.replace(EMPTY_LINE_RUN_RE, '\n\n');
+  }
 
-  // Remove HTML comments
-  cleaned = cleaned.replace(/<!--[\s\S]*?-->/g, '');
+  // Remove HTML comments (may leave trailing whitespace behind)
+  if (cleaned.includes('<!--')) {
+    cleaned = trimLineEnds(stripHtmlComments(cleaned));
+  }
 
   // Clean up relative links (basic cleanup)
-  cleaned = cleaned.replace(/\]\(\.\/([^)]+)\)/g, ']($1)');
-
-  // Remove trailing whitespace from lines
-  cleaned = cleaned
-    .split('\n')
-    .map((line) => line.trimEnd())
-    .join('\n');
+  if (cleaned.includes('](./')) {
+    cleaned = cleaned.replace(RELATIVE_LINK_RE, ']($1)');
+  }
 
   return cleaned.trim();
 }
@@ -30,6 +30,13 @@ class Logger {
     return LOG_LEVELS[level] >= this.minLevel;
   }
 
+  /**
+   * Whether debug messages are emitted; lets hot paths skip building log context
+   */
+  isDebugEnabled(): boolean {
+    return this.shouldLog('debug');
+  }
+
   private formatMessage(level: LogLevel, message: string, context?: LogContext): string {
     const timestamp = new Date().toISOString();
     const contextStr = context ? ` ${JSON.stringify(context)}` : '';